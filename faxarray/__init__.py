@@ -15,7 +15,7 @@ Example usage:
     >>> temp.plot()
     >>> fa.to_netcdf('output.nc')
     >>> 
-    >>> # Or use xarray directly (after importing faxarray)
+    >>> # Or use xarray directly (the backend is found via entry points)
     >>> import xarray as xr
     >>> ds = xr.open_dataset('pfABOFABOF+0001', engine='faxarray')
     >>> # Or auto-detect:
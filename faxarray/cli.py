@@ -189,11 +189,13 @@ def cmd_convert_multi(args):
     seen = set()
     deaccum_vars = [v for v in deaccum_vars if not (v in seen or seen.add(v))]
     
+    if args.chunk_hours is not None:
+        print("Warning: --chunk-hours is deprecated and ignored", file=sys.stderr)
+    
     if not args.quiet:
         print(f"Converting {args.input} -> {args.output}")
         if deaccum_vars:
             print(f"  De-accumulating: {deaccum_vars}")
-        print(f"  Chunk size: {args.chunk_hours} hour(s)")
     
     try:
         # Parse variables list
@@ -207,7 +209,6 @@ def cmd_convert_multi(args):
             args.input,
             variables=var_list,
             deaccumulate=deaccum_vars if deaccum_vars else None,
-            chunk_hours=args.chunk_hours,
             output_file=args.output,
             progress=not args.quiet
         )
@@ -268,8 +269,9 @@ def main():
                               help='Variables to de-accumulate (space or comma separated)')
     multi_parser.add_argument('--dlist', metavar='FILE',
                               help='File with list of variables to de-accumulate (one per line)')
-    multi_parser.add_argument('--chunk-hours', type=int, default=1,
-                              help='Hours to hold in memory at once (default: 1)')
+    # Deprecated: timesteps are always written one at a time
+    multi_parser.add_argument('--chunk-hours', type=int, default=None,
+                              help=argparse.SUPPRESS)
     multi_parser.add_argument('-v', '--variables', nargs='*', default=[],
                               help='Variables to include (default: all). Use for low memory.')
     multi_parser.add_argument('--quiet', '-q', action='store_true',
@@ -13,6 +13,7 @@ from typing import Dict, List, Optional, Tuple, Union, Iterator
 from pathlib import Path
 from collections import defaultdict
 import threading
+import functools
 
 try:
     import dask.array as da
@@ -24,6 +25,33 @@ except ImportError:
 # Global lock for EPyGrAM access (not thread-safe)
 EPYGRAM_LOCK = threading.Lock()
 
+def _read_with_lock(path: str, name: str) -> np.ndarray:
+    """Read one field under EPYGRAM_LOCK (module-level so it can be pickled)."""
+    with EPYGRAM_LOCK:
+        # Create a FRESH reader for each access to avoid state issues
+        reader = FAReader(path)
+        try:
+            return reader.read_field(name)
+        finally:
+            reader.close()
+
+
+def _read_field_or_nan(path: str, name: str, shape: Tuple[int, ...]) -> np.ndarray:
+    """
+    Read one field under EPYGRAM_LOCK; NaN if it is not on the grid.
+    
+    Used by lazy multi-file series, where a field is only read when
+    computed: like the eager readers (which skip such fields), a field
+    that is off-grid in one file becomes missing data there. Fields absent
+    from a file never get here (see _open_lazy_series). Read errors, e.g.
+    a file deleted since the series was opened, are raised.
+    """
+    data = _read_with_lock(path, name)
+    if data.shape != tuple(shape):
+        return np.full(shape, np.nan)
+    return data
+
+
 def read_field_delayed(filepath: str, field_name: str):
     """
     Read a field lazily using dask.delayed.
@@ -31,15 +59,6 @@ def read_field_delayed(filepath: str, field_name: str):
     """
     if not HAS_DASK:
         raise ImportError("Dask is required for lazy loading")
-        
-    def _read_with_lock(path, name):
-        with EPYGRAM_LOCK:
-            # Create a FRESH reader for each access to avoid state issues
-            reader = FAReader(path)
-            try:
-                return reader.read_field(name)
-            finally:
-                reader.close()
     
     return delayed(_read_with_lock)(filepath, field_name)
 
@@ -137,6 +156,110 @@ def detect_3d_fields(field_names: List[str]) -> Dict[str, Dict]:
     return result
 
 
+# Attributes of the valid time coordinate
+_TIME_ATTRS = {
+    'long_name': 'valid time',
+    'standard_name': 'time',
+}
+
+# NetCDF encoding of the valid time coordinate (ncview needs this)
+_TIME_ENCODING = {
+    'units': 'hours since 1970-01-01',
+    'calendar': 'proleptic_gregorian',
+    'dtype': 'float64',
+}
+
+
+def _validity_attrs(validity: dict) -> Dict[str, str]:
+    """base_time / lead_time dataset attributes from FAReader.get_validity()."""
+    attrs = {}
+    if validity['valid_time'] is not None:
+        if validity['base_time'] is not None:
+            attrs['base_time'] = str(validity['base_time'])
+        if validity['lead_time'] is not None:
+            attrs['lead_time'] = str(validity['lead_time'])
+    return attrs
+
+
+def _time_values(valid_times) -> np.ndarray:
+    """Valid times (datetime / datetime64) as a datetime64[ns] array."""
+    return np.array(valid_times, dtype='datetime64[ns]')
+
+
+def _build_dataset(data_vars: Dict[str, xr.Variable],
+                   lat: np.ndarray,
+                   lon: np.ndarray,
+                   level_coords: Dict[str, Dict],
+                   attrs: Dict) -> xr.Dataset:
+    """
+    Assemble a Dataset from pre-built Variables.
+    
+    Data variables and coordinates are wrapped as ``xr.Variable`` up front
+    (no copies), and the level coordinates get their CF attributes here
+    rather than through ``ds[dim].attrs`` afterwards. On xarray >= 2023.08
+    the coordinates are handed over as an ``xr.Coordinates`` object, so the
+    constructor uses them as-is instead of re-merging them. Only the 1D
+    level coordinates are indexed; the 2D lat/lon never are.
+    
+    lat/lon are used as they are: the decoded grids are read-only arrays
+    shared by every file on the same grid (copy them before editing).
+    """
+    coords = {
+        'lat': xr.Variable(('y', 'x'), lat),
+        'lon': xr.Variable(('y', 'x'), lon),
+    }
+    for dim_name, coord_info in level_coords.items():
+        coords[dim_name] = xr.Variable((dim_name,), coord_info['values'],
+                                       coord_info['attrs'])
+    
+    if hasattr(xr, 'Coordinates'):
+        coords = xr.Coordinates(coords)
+    
+    return xr.Dataset(data_vars, coords=coords, attrs=attrs)
+
+
+@functools.lru_cache(maxsize=32)
+def _detect_3d_fields_cached(field_names: Tuple[str, ...]) -> Dict[str, Dict]:
+    """
+    detect_3d_fields memoized on the field list.
+    
+    Files of one forecast share their field list, so the level grouping is
+    computed once per series instead of once per file. The result is
+    shared: callers must not modify it.
+    """
+    return detect_3d_fields(list(field_names))
+
+
+def _dataset_var_names(field_names: List[str], stack_levels: bool = True) -> Dict[str, str]:
+    """
+    Map FA field names to the Dataset variable they end up in.
+    
+    Mirrors the naming used by FADataset.to_xarray: dots become underscores
+    and, with stack_levels, every level of a 3D field maps to its stacked
+    variable (e.g. S001TEMPERATURE -> TEMPERATURE, P85000TEMPERATURE ->
+    P_TEMPERATURE).
+    
+    Parameters
+    ----------
+    field_names : list of str
+        List of field names from FA file
+    stack_levels : bool, default True
+        Whether 3D fields are stacked
+        
+    Returns
+    -------
+    dict
+        Mapping of field name to Dataset variable name
+    """
+    names = {name: name.replace('.', '_') for name in field_names}
+    if stack_levels:
+        for base_name, group_info in _detect_3d_fields_cached(tuple(field_names)).items():
+            safe_name = base_name.replace('.', '_')
+            for _, name in group_info['levels']:
+                names[name] = safe_name
+    return names
+
+
 def get_surface_fields(field_names: List[str]) -> List[str]:
     """
     Get field names that are surface (2D) fields, not part of 3D level data.
@@ -286,7 +409,8 @@ class FADataset:
     Parameters
     ----------
     filepath : str
-        Path to the FA file
+        Path to the FA file (bytes or a binary file object are also
+        accepted, see FAReader; such datasets cannot be read lazily)
         
     Attributes
     ----------
@@ -317,8 +441,8 @@ class FADataset:
     """
     
     def __init__(self, filepath: str):
-        self.filepath = str(filepath)
-        self._reader = FAReader(self.filepath)
+        self._reader = FAReader(filepath)
+        self.filepath = str(self._reader.filepath)
         self._cache: Dict[str, np.ndarray] = {}
         self._loaded_all = False
     
@@ -355,12 +479,12 @@ class FADataset:
     
     @property
     def lon(self) -> np.ndarray:
-        """2D longitude grid."""
+        """2D longitude grid (read-only: shared by files on the same grid)."""
         return self.geometry.lons
     
     @property
     def lat(self) -> np.ndarray:
-        """2D latitude grid."""
+        """2D latitude grid (read-only: shared by files on the same grid)."""
         return self.geometry.lats
     
     def __len__(self) -> int:
@@ -487,7 +611,33 @@ class FADataset:
         vars_list = self.select_levels(variable, levels)
         return np.stack([v.data for v in vars_list], axis=0)
     
-    def load(self, progress: bool = False):
+    def _stack_fields(self, field_names: List[str]) -> np.ndarray:
+        """
+        Stack 2D fields into a (level, y, x) array without keeping two copies.
+
+        Each level is written into a preallocated buffer (of the common type
+        of all levels, like np.stack) and its cache entry is dropped, so the
+        per-level arrays can be freed instead of living on next to the
+        stacked copy. The buffer is not shared with the cache: editing the
+        returned array does not change what ``fa[name]`` reads later.
+        """
+        stacked = None
+        for k, name in enumerate(field_names):
+            data = self._cache.pop(name, None)
+            if data is None:
+                data = self._reader.read_field(name)
+            if stacked is None:
+                stacked = np.empty((len(field_names),) + data.shape, dtype=data.dtype)
+            elif np.result_type(stacked, data) != stacked.dtype:
+                # A wider level: upcast what is stacked so far
+                stacked = stacked.astype(np.result_type(stacked, data))
+            stacked[k] = data
+        # The dropped levels are read again when needed
+        self._loaded_all = False
+        return stacked
+
+    def load(self, progress: bool = False, parallel: bool = False,
+             skip: Optional[set] = None):
         """
         Load all variables into memory.
         
@@ -495,19 +645,31 @@ class FADataset:
         ----------
         progress : bool
             Print progress
+        parallel : bool
+            Decode fields in worker processes (see FAReader.read_fields_parallel)
+        skip : set of str, optional
+            Field names not to read (the dataset then stays partially loaded)
         """
         if not self._loaded_all:
-            self._cache = self._reader.read_all_fields(
+            fields = self._reader.read_all_fields(
                 filter_shape=self.shape,
-                progress=progress
+                progress=progress,
+                parallel=parallel,
+                skip=skip
             )
-            self._loaded_all = True
+            if skip:
+                self._cache.update(fields)
+            else:
+                self._cache = fields
+                self._loaded_all = True
     
     def to_xarray(self, 
                   variables: Optional[List[str]] = None,
                   stack_levels: bool = True,
                   levels: Optional[List[int]] = None,
-                  progress: bool = False) -> xr.Dataset:
+                  progress: bool = False,
+                  parallel: bool = False,
+                  drop_variables: Optional[List[str]] = None) -> xr.Dataset:
         """
         Convert to xarray.Dataset.
         
@@ -523,18 +685,37 @@ class FADataset:
             If None, includes all available levels.
         progress : bool
             Print progress
+        parallel : bool, default False
+            If True, decode fields in worker processes instead of one by one.
+            Pays off on large files with many packed or spectral fields.
+        drop_variables : list of str, optional
+            Dataset variables to leave out (names as they appear in the
+            result, e.g. 'TEMPERATURE' for stacked levels). The fields
+            behind them are never read.
             
         Returns
         -------
         xarray.Dataset
         """
+        # Fields behind dropped variables are skipped before any reading
+        skip = set()
+        if drop_variables:
+            drop_set = set(drop_variables)
+            candidates = self.variables if variables is None else variables
+            var_names = _dataset_var_names(candidates, stack_levels)
+            skip = {name for name, var_name in var_names.items() if var_name in drop_set}
+        
         # Load all data first
         if variables is None:
-            self.load(progress=progress)
-            all_fields = list(self._cache.keys())
+            self.load(progress=progress, parallel=parallel, skip=skip)
+            all_fields = [name for name in self._cache if name not in skip]
         else:
-            all_fields = variables
-            for name in variables:
+            all_fields = [name for name in variables if name not in skip]
+            variables = all_fields
+            missing = [name for name in variables if name not in self._cache]
+            if parallel and missing:
+                self._cache.update(self._reader.read_fields_parallel(missing))
+            for name in missing:
                 if name not in self._cache:
                     self._cache[name] = self._reader.read_field(name)
         
@@ -543,7 +724,7 @@ class FADataset:
         
         if stack_levels:
             # Detect 3D fields and stack them
-            level_groups = detect_3d_fields(all_fields)
+            level_groups = _detect_3d_fields_cached(tuple(all_fields))
             processed_fields = set()
             
             if progress:
@@ -568,13 +749,8 @@ class FADataset:
                 level_nums = [lvl for lvl, _ in level_list]
                 field_names = [name for _, name in level_list]
                 
-                # Make sure all fields are in cache
-                for name in field_names:
-                    if name not in self._cache:
-                        self._cache[name] = self._reader.read_field(name)
-                
                 # Stack into 3D array
-                stacked = np.stack([self._cache[name] for name in field_names], axis=0)
+                stacked = self._stack_fields(field_names)
                 safe_name = base_name.replace('.', '_')
                 
                 # Determine dimension name based on level type
@@ -583,8 +759,8 @@ class FADataset:
                 else:
                     dim_name = 'pressure'
                 
-                data_vars[safe_name] = (
-                    [dim_name, 'y', 'x'], 
+                data_vars[safe_name] = xr.Variable(
+                    (dim_name, 'y', 'x'), 
                     stacked, 
                     {
                         'level_values': level_nums, 
@@ -611,75 +787,40 @@ class FADataset:
             for name in all_fields:
                 if name not in processed_fields and name in self._cache:
                     safe_name = name.replace('.', '_')
-                    data_vars[safe_name] = (['y', 'x'], self._cache[name])
+                    data_vars[safe_name] = xr.Variable(('y', 'x'), self._cache[name])
         else:
             # Original behavior: all fields as 2D
             for name in all_fields:
                 if name not in self._cache:
                     self._cache[name] = self._reader.read_field(name)
                 safe_name = name.replace('.', '_')
-                data_vars[safe_name] = (['y', 'x'], self._cache[name])
-        
-        # Build coordinates
-        coords = {
-            'lat': (['y', 'x'], self.lat),
-            'lon': (['y', 'x'], self.lon)
-        }
-        
-        # Add level coordinates from what we detected
-        for dim_name, coord_info in level_coords.items():
-            coords[dim_name] = coord_info['values']
+                data_vars[safe_name] = xr.Variable(('y', 'x'), self._cache[name])
         
         # Get time validity info
         validity = self._reader.get_validity()
         valid_time = validity['valid_time']
-        base_time = validity['base_time']
-        lead_time = validity['lead_time']
         
         # Create dataset (without time dim yet)
-        ds = xr.Dataset(
-            data_vars,
-            coords=coords,
-            attrs={
-                'source': self.filepath,
-                'Conventions': 'CF-1.8',
-            }
-        )
-        
-        # Add CF-compliant attributes to level coordinates
-        for dim_name, coord_info in level_coords.items():
-            if dim_name in ds.coords:
-                ds[dim_name].attrs = coord_info['attrs']
+        ds = _build_dataset(data_vars, self.lat, self.lon, level_coords, {
+            'source': self.filepath,
+            'Conventions': 'CF-1.8',
+        })
         
         # Add time dimension to all variables
         if valid_time is not None:
-            # Expand all data variables to include time dimension at axis 0
-            ds = ds.expand_dims(dim={'time': 1}, axis=0)
-            
-            # Assign the actual time coordinate value  
-            # Use pandas Timestamp for proper CF encoding
-            import pandas as pd
-            time_value = pd.Timestamp(str(valid_time))
-            ds = ds.assign_coords(time=[time_value])
+            # Expand all data variables to include time dimension at axis 0,
+            # with the valid time as a ready-made datetime64[ns] coordinate
+            # (nothing for xarray/pandas to parse or decode)
+            ds = ds.expand_dims(dim={'time': _time_values([valid_time])}, axis=0)
             
             # Add CF-compliant time coordinate attributes for ncview compatibility
-            ds['time'].attrs = {
-                'long_name': 'valid time',
-                'standard_name': 'time',
-            }
+            ds.variables['time'].attrs.update(_TIME_ATTRS)
             
             # Encode time for NetCDF (ncview needs this)
-            ds['time'].encoding = {
-                'units': 'hours since 1970-01-01',
-                'calendar': 'proleptic_gregorian',
-                'dtype': 'float64',
-            }
+            ds.variables['time'].encoding = dict(_TIME_ENCODING)
             
             # Store base_time and lead_time as attributes
-            if base_time is not None:
-                ds.attrs['base_time'] = str(base_time)
-            if lead_time is not None:
-                ds.attrs['lead_time'] = str(lead_time)
+            ds.attrs.update(_validity_attrs(validity))
         
         return ds
     
@@ -720,7 +861,7 @@ class FADataset:
         processed_fields = set()
         
         if stack_levels:
-            level_groups = detect_3d_fields(all_fields)
+            level_groups = _detect_3d_fields_cached(tuple(all_fields))
             
             for base_name, group_info in level_groups.items():
                 level_list = group_info['levels']
@@ -752,8 +893,8 @@ class FADataset:
                 # Determine dimension name
                 dim_name = 'level' if level_type == 'model' else 'pressure'
                 
-                data_vars[safe_name] = (
-                    [dim_name, 'y', 'x'], 
+                data_vars[safe_name] = xr.Variable(
+                    (dim_name, 'y', 'x'), 
                     stacked, 
                     {
                         'level_values': level_nums, 
@@ -785,7 +926,7 @@ class FADataset:
                         dtype=np.float64
                     )
                     safe_name = name.replace('.', '_')
-                    data_vars[safe_name] = (['y', 'x'], lazy_arr)
+                    data_vars[safe_name] = xr.Variable(('y', 'x'), lazy_arr)
         else:
             # No stacking - all 2D lazy arrays
             for name in all_fields:
@@ -796,47 +937,22 @@ class FADataset:
                     dtype=np.float64
                 )
                 safe_name = name.replace('.', '_')
-                data_vars[safe_name] = (['y', 'x'], lazy_arr)
+                data_vars[safe_name] = xr.Variable(('y', 'x'), lazy_arr)
 
-        # Build coordinates
-        coords = {
-            'lat': (['y', 'x'], self.lat),
-            'lon': (['y', 'x'], self.lon)
-        }
-        
-        # Add level coordinates
-        for dim_name, coord_info in level_coords.items():
-            coords[dim_name] = coord_info['values']
-            
         # Get time validity info
         validity = self._reader.get_validity()
         valid_time = validity['valid_time']
         
         # Create dataset
-        ds = xr.Dataset(
-            data_vars,
-            coords=coords,
-            attrs={
-                'source': self.filepath,
-                'Conventions': 'CF-1.8',
-            }
-        )
-        
-        # Add CF-compliant attributes to level coordinates
-        for dim_name, coord_info in level_coords.items():
-            if dim_name in ds.coords:
-                ds[dim_name].attrs = coord_info['attrs']
+        ds = _build_dataset(data_vars, self.lat, self.lon, level_coords, {
+            'source': self.filepath,
+            'Conventions': 'CF-1.8',
+        })
         
         # Add time dimension
         if valid_time is not None:
-            ds = ds.expand_dims(dim={'time': 1}, axis=0)
-            import pandas as pd
-            time_value = pd.Timestamp(str(valid_time))
-            ds = ds.assign_coords(time=[time_value])
-            ds['time'].attrs = {
-                'long_name': 'valid time',
-                'standard_name': 'time',
-            }
+            ds = ds.expand_dims(dim={'time': _time_values([valid_time])}, axis=0)
+            ds.variables['time'].attrs.update(_TIME_ATTRS)
             
         return ds
     
@@ -5,18 +5,98 @@ This module wraps EPyGrAM's falfilfa4py for reading FA files,
 providing a cleaner interface for the rest of the package.
 """
 
+import os
+import hashlib
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, BinaryIO, Container, Union
 from dataclasses import dataclass, field
 
 
+# Decoded lon/lat grids keyed by a digest of the geometry definition.
+# Files from the same run share their grid, so every file after the first
+# reuses the same arrays instead of decoding them again (and xarray can
+# then compare the coordinates by identity when combining files).
+_GEOMETRY_CACHE: Dict[bytes, Tuple[np.ndarray, np.ndarray]] = {}
+_GEOMETRY_CACHE_SIZE = 8
+
+
+def _key_value(value):
+    """
+    Plain, value-based form of one geometry parameter (for _geometry_key).
+    
+    Numbers, strings, arrays and containers of them are kept by value;
+    EPyGrAM angles (objects with ``get('degrees')``) become their value in
+    degrees. Anything else raises TypeError: its repr may not describe its
+    value (the default one embeds id()).
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _key_value(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_key_value(v) for v in value)
+    get = getattr(value, 'get', None)
+    if callable(get):
+        return float(get('degrees'))
+    raise TypeError(f"no value-based key for {type(value).__name__}")
+
+
+def _geometry_key(geometry, shape: Tuple[int, ...]) -> bytes:
+    """
+    Digest of everything that defines the lon/lat grid of a geometry.
+    
+    Built from the explicit values of the geometry (name, dimensions, grid
+    parameters such as resolutions, projection parameters such as the
+    reference lon/lat), never from object reprs. Raises TypeError if a
+    parameter has no value-based form.
+    """
+    desc = repr((
+        str(geometry.name),
+        tuple(int(n) for n in shape),
+        _key_value(getattr(geometry, 'dimensions', None)),
+        _key_value(getattr(geometry, 'grid', None)),
+        _key_value(getattr(geometry, 'projection', None)),
+    ))
+    return hashlib.blake2b(desc.encode(), digest_size=16).digest()
+
+
+def _get_lonlat(geometry, shape: Tuple[int, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return (lons, lats) for a geometry, decoding them only once per grid.
+    
+    Cached grids are shared by every file on that grid and are read-only.
+    A geometry that cannot be keyed by value is decoded without caching.
+    """
+    try:
+        key = _geometry_key(geometry, shape)
+    except TypeError:
+        return geometry.get_lonlat_grid()
+    lonlat = _GEOMETRY_CACHE.pop(key, None)
+    if lonlat is None:
+        lons, lats = geometry.get_lonlat_grid()
+        # The arrays are shared by every dataset on this grid
+        lons.flags.writeable = False
+        lats.flags.writeable = False
+        if len(_GEOMETRY_CACHE) >= _GEOMETRY_CACHE_SIZE:
+            # Evict the least recently used grid
+            _GEOMETRY_CACHE.pop(next(iter(_GEOMETRY_CACHE)))
+        lonlat = (lons, lats)
+    # (Re)insert as most recently used
+    _GEOMETRY_CACHE[key] = lonlat
+    return lonlat
+
+
 @dataclass
 class FAGeometry:
     """Represents the geometry/grid of an FA file."""
     name: str  # e.g., 'mercator', 'lambert', 'regular_lonlat'
     shape: Tuple[int, int]  # (y, x)
-    lons: np.ndarray  # 2D array of longitudes
-    lats: np.ndarray  # 2D array of latitudes
+    lons: np.ndarray  # 2D array of longitudes (read-only, shared per grid)
+    lats: np.ndarray  # 2D array of latitudes (read-only, shared per grid)
     projection: Optional[Dict[str, Any]] = None
     
     @property
@@ -37,6 +117,66 @@ class FAFieldInfo:
     dtype: str = 'float64'
 
 
+def _fadvise(path: str, advice: str):
+    """
+    Apply a posix_fadvise hint (e.g. ``'POSIX_FADV_WILLNEED'``) to a file.
+    
+    Only page-cache hints are useful here: EPyGrAM reads through its own
+    Fortran file descriptor, so per-descriptor hints such as SEQUENTIAL
+    would not reach it, but the page cache is shared. No-op where
+    posix_fadvise is unavailable (macOS, Windows).
+    """
+    flag = getattr(os, advice, None)
+    if flag is None or not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, flag)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def _spool_dir(size: Optional[int]) -> Optional[str]:
+    """
+    Directory for spooling in-memory FA content of the given size.
+    
+    Prefers /dev/shm (tmpfs: the copy stays in RAM and never reaches disk)
+    when it has room for ``size`` bytes; otherwise returns None, i.e. the
+    default temporary directory. Unknown sizes always go to the default.
+    """
+    shm = '/dev/shm'
+    if size is None or not os.access(shm, os.W_OK):
+        return None
+    try:
+        st = os.statvfs(shm)
+    except OSError:
+        return None
+    # Keep some headroom: other processes share the tmpfs
+    if size * 2 < st.f_bavail * st.f_frsize:
+        return shm
+    return None
+
+
+def _prefetch_file(path: str):
+    """Ask the kernel to start reading the whole file into the page cache."""
+    _fadvise(path, 'POSIX_FADV_WILLNEED')
+
+
+def _release_file_cache(path: str):
+    """Tell the kernel a fully-read file's cached pages can be dropped."""
+    _fadvise(path, 'POSIX_FADV_DONTNEED')
+
+
+def _read_fields_in_process(filepath: str, names: List[str],
+                            convert_spectral: bool) -> Dict[str, np.ndarray]:
+    """Worker for FAReader.read_fields_parallel: read fields with a private reader."""
+    with FAReader(filepath) as reader:
+        return reader.read_fields(names, convert_spectral)
+
+
 class FAReader:
     """
     Low-level FA file reader using EPyGrAM backend.
@@ -47,8 +187,11 @@ class FAReader:
     
     Parameters
     ----------
-    filepath : str
-        Path to the FA file
+    filepath : str, bytes or binary file-like
+        Path to the FA file, or the file content itself (e.g. a member
+        streamed out of a tar archive). EPyGrAM can only open files by path,
+        so in-memory content is spooled to a private temporary file that is
+        removed again on close().
         
     Example
     -------
@@ -58,7 +201,10 @@ class FAReader:
     >>> reader.close()
     """
     
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: Union[str, bytes, memoryview, BinaryIO]):
+        self._spool_path: Optional[str] = None
+        if not isinstance(filepath, (str, os.PathLike)):
+            filepath = self._spool(filepath)
         self.filepath = filepath
         self._resource = None
         self._geometry: Optional[FAGeometry] = None
@@ -82,11 +228,33 @@ class FAReader:
         import epygram
         self._resource = epygram.formats.resource(self.filepath, 'r')
     
+    def _spool(self, data: Union[bytes, memoryview, BinaryIO]) -> str:
+        """Write in-memory FA content to a temporary file and return its path."""
+        import shutil
+        import tempfile
+        
+        size = len(data) if isinstance(data, (bytes, bytearray, memoryview)) else None
+        fd, path = tempfile.mkstemp(prefix='faxarray-', suffix='.fa',
+                                    dir=_spool_dir(size))
+        self._spool_path = path
+        with os.fdopen(fd, 'wb') as f:
+            if isinstance(data, (bytes, bytearray, memoryview)):
+                f.write(data)
+            else:
+                shutil.copyfileobj(data, f, 1 << 20)
+        return path
+    
     def close(self):
         """Close the FA file."""
         if self._resource is not None:
             self._resource.close()
             self._resource = None
+        if self._spool_path is not None:
+            try:
+                os.remove(self._spool_path)
+            except OSError:
+                pass
+            self._spool_path = None
     
     def __enter__(self):
         return self
@@ -118,7 +286,7 @@ class FAReader:
                     f = self._resource.readfield(fname)
                     data = f.getdata()
                     if data.ndim == 2:
-                        lons, lats = f.geometry.get_lonlat_grid()
+                        lons, lats = _get_lonlat(f.geometry, data.shape)
                         proj_info = None
                         if hasattr(f.geometry, 'projection'):
                             proj_info = dict(f.geometry.projection)
@@ -140,7 +308,7 @@ class FAReader:
                     f.sp2gp()
                 data = f.getdata()
                 if data.ndim == 2:
-                    lons, lats = f.geometry.get_lonlat_grid()
+                    lons, lats = _get_lonlat(f.geometry, data.shape)
                     return FAGeometry(
                         name=f.geometry.name,
                         shape=data.shape,
@@ -259,9 +427,58 @@ class FAReader:
         
         return result
     
+    def read_fields_parallel(self, names: List[str],
+                             convert_spectral: bool = True,
+                             max_workers: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Read multiple fields using a pool of worker processes.
+        
+        EPyGrAM's Fortran reader is not thread-safe, so each worker process
+        opens its own handle on the file and decodes a share of the fields.
+        Worth it when decoding dominates (packed or spectral fields); for a
+        handful of fields the process start-up costs more than it saves.
+        
+        Parameters
+        ----------
+        names : list of str
+            Field names to read
+        convert_spectral : bool
+            If True, convert spectral fields to gridpoint
+        max_workers : int, optional
+            Number of worker processes (default: number of CPUs)
+            
+        Returns
+        -------
+        dict
+            Dictionary mapping field names to numpy arrays, in the order of
+            `names`. Fields that cannot be read are skipped, as in read_fields.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        import multiprocessing
+        
+        names = list(names)
+        n_workers = min(max_workers or os.cpu_count() or 1, len(names))
+        if n_workers <= 1:
+            return self.read_fields(names, convert_spectral)
+        
+        # Round-robin split so expensive level groups are spread over workers
+        parts = [names[i::n_workers] for i in range(n_workers)]
+        
+        result = {}
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as ex:
+            for part in ex.map(_read_fields_in_process,
+                               [self.filepath] * n_workers, parts,
+                               [convert_spectral] * n_workers):
+                result.update(part)
+        
+        return {name: result[name] for name in names if name in result}
+    
     def read_all_fields(self, convert_spectral: bool = True,
                         filter_shape: Optional[Tuple[int, int]] = None,
-                        progress: bool = False) -> Dict[str, np.ndarray]:
+                        progress: bool = False,
+                        parallel: bool = False,
+                        skip: Optional[Container[str]] = None) -> Dict[str, np.ndarray]:
         """
         Read all fields from the file.
         
@@ -273,6 +490,11 @@ class FAReader:
             Only return fields matching this shape
         progress : bool
             If True, print progress
+        parallel : bool
+            If True, decode fields in worker processes
+            (see read_fields_parallel)
+        skip : container of str, optional
+            Field names not to read at all
             
         Returns
         -------
@@ -282,10 +504,22 @@ class FAReader:
         if filter_shape is None:
             filter_shape = self.geometry.shape
         
+        if skip:
+            names = [name for name in self.fields if name not in skip]
+        else:
+            names = self.fields
+            # Every record is about to be read: let the kernel prefetch the file
+            _prefetch_file(self.filepath)
+        
+        if parallel:
+            fields = self.read_fields_parallel(names, convert_spectral)
+            return {name: data for name, data in fields.items()
+                    if data.shape == filter_shape}
+        
         result = {}
-        total = len(self.fields)
+        total = len(names)
         
-        for i, name in enumerate(self.fields):
+        for i, name in enumerate(names):
             try:
                 data = self.read_field(name, convert_spectral)
                 if data.shape == filter_shape:
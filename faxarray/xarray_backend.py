@@ -1,9 +1,10 @@
 """
 xarray backend engine for FA files.
 
-This module allows opening FA files directly with xarray:
+This module allows opening FA files directly with xarray. The backend is
+registered through the ``xarray.backends`` entry point declared in
+pyproject.toml, so xarray only imports it when it is actually needed:
     
-    import faxarray  # Registers the backend
     import xarray as xr
     
     ds = xr.open_dataset('pfABOFABOF+0001')  # Auto-detects FA format
@@ -12,12 +13,109 @@ This module allows opening FA files directly with xarray:
 """
 
 import os
+import re
+import stat
+import warnings
+import contextlib
+import functools
+from collections import deque
+from glob import glob
+from types import MappingProxyType
 import numpy as np
 import xarray as xr
 from xarray.backends import BackendEntrypoint
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
 
-from .reader import FAReader
+from .reader import FAReader, _release_file_cache
+
+
+# CF attributes shared by every dataset opened through this backend.
+# Read-only in practice; copied into ds.attrs / Variable.attrs on use.
+_CF_GLOBAL_ATTRS = MappingProxyType({
+    'Conventions': 'CF-1.8',
+    'institution': 'Météo-France',
+    'source_format': 'FA',
+})
+
+_LAT_ATTRS = MappingProxyType({
+    'units': 'degrees_north',
+    'long_name': 'latitude',
+    'standard_name': 'latitude',
+})
+
+_LON_ATTRS = MappingProxyType({
+    'units': 'degrees_east',
+    'long_name': 'longitude',
+    'standard_name': 'longitude',
+})
+
+# Forecast hour suffix of FA file names (pfABOFABOF+0024)
+_FA_HOUR_RE = re.compile(r'\+(\d{4})$')
+
+
+# NetCDF encoding of de-accumulated fields for each open_mfdataset dtype
+_DEACCUM_ENCODINGS = {
+    'float32': {},
+    'float64': {},
+    'int16': {'dtype': 'int16', 'scale_factor': 0.01, '_FillValue': np.int16(-32768)},
+}
+
+
+def _expand_pattern(pattern: str) -> list:
+    """
+    List the files matching a glob pattern (unsorted).
+    
+    A pattern without wildcards is taken as a single path. When only the
+    file name has wildcards, the directory is listed once with os.scandir,
+    which knows each entry's type without extra stat calls, and directories
+    are skipped. Other patterns go through glob.
+    """
+    import fnmatch
+    from glob import has_magic
+    
+    if not has_magic(pattern):
+        return [pattern] if os.path.exists(pattern) else []
+    
+    dirname, basename = os.path.split(pattern)
+    if has_magic(dirname):
+        return glob(pattern)
+    
+    match = re.compile(fnmatch.translate(basename)).match
+    # Like glob, hidden files only match patterns starting with a dot
+    hidden_ok = basename.startswith('.')
+    try:
+        with os.scandir(dirname or os.curdir) as entries:
+            return [os.path.join(dirname, entry.name) for entry in entries
+                    if (hidden_ok or not entry.name.startswith('.'))
+                    and match(entry.name) and entry.is_file()]
+    except OSError:
+        return []
+
+
+def _extract_hour(filepath: str) -> int:
+    """Forecast hour from an FA file name like pfABOFABOF+0024 (0 if absent)."""
+    match = _FA_HOUR_RE.search(filepath)
+    return int(match.group(1)) if match else 0
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_fa_by_name(filename: str) -> bool:
+    """
+    Check if a path looks like an FA file from its name alone (no I/O).
+    
+    Cached: xarray asks every backend about every path, often repeatedly.
+    """
+    # Check by extension first
+    if filename.lower().endswith(('.fa', '.sfx')):
+        return True
+    
+    # Check by filename pattern (common FA naming conventions):
+    # pfABOFABOF+0001, PFABOFABOF+0001, ICMSHABOF+0001
+    basename = os.path.basename(filename)
+    if basename.startswith(('pf', 'PF', 'ICMSH')):
+        return True
+    # Files with + in name and no extension
+    return '+' in basename and not os.path.splitext(basename)[1]
 
 
 def is_fa_file(filename: str) -> bool:
@@ -29,7 +127,7 @@ def is_fa_file(filename: str) -> bool:
     
     Parameters
     ----------
-    filename : str
+    filename : str or path-like
         Path to the file
         
     Returns
@@ -37,48 +135,95 @@ def is_fa_file(filename: str) -> bool:
     bool
         True if the file appears to be an FA file
     """
-    # Check by extension first (fast path)
-    ext = os.path.splitext(filename)[1].lower()
-    if ext in ('.fa', '.sfx'):
-        return True
+    # Plain str for the name checks (and a hashable cache key)
+    filename = os.fspath(filename)
     
-    # Check by filename pattern (common FA naming conventions)
-    basename = os.path.basename(filename)
-    fa_patterns = [
-        basename.startswith('pf'),      # pfABOFABOF+0001
-        basename.startswith('ICMSH'),   # ICMSHABOF+0001
-        basename.startswith('PF'),      # PFABOFABOF+0001
-        '+' in basename and not ext,    # Files with + in name and no extension
-    ]
-    if any(fa_patterns):
+    # Check by extension / naming convention first (fast path, no I/O)
+    if _is_fa_by_name(filename):
         return True
     
     # Check by file content (magic bytes) - LFI files have specific structure
-    # This is a fallback for unusual naming
+    # This is a fallback for unusual naming. One stat gives both the size and
+    # the cache key, so unchanged files are only ever opened once.
     try:
-        with open(filename, 'rb') as f:
-            # Read first 8 bytes
-            header = f.read(8)
-            if len(header) < 8:
-                return False
-            
-            # LFI files start with record length markers (Fortran unformatted)
-            # The first 4 bytes are typically a small integer (record length)
-            # This is not 100% reliable but helps for detection
-            first_int = int.from_bytes(header[:4], byteorder='little')
-            
-            # FA files typically have a small initial record (< 1MB)
-            if 0 < first_int < 1_000_000:
-                # Could be FA - try to validate further
-                # Check if file size is reasonable for FA (> 1KB)
-                f.seek(0, 2)  # Seek to end
-                size = f.tell()
-                if size > 1024:
-                    return True
+        st = os.stat(filename)
     except (IOError, OSError):
-        pass
+        return False
+    if not stat.S_ISREG(st.st_mode):
+        return False
+    return _probe_fa(filename, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=1024)
+def _probe_fa(filename: str, mtime_ns: int, size: int) -> bool:
+    """Magic-byte check for FA content, cached per (path, mtime, size)."""
+    # Check if file size is reasonable for FA (> 1KB)
+    if size <= 1024:
+        return False
+    
+    try:
+        with open(filename, 'rb', buffering=0) as f:
+            # Only the first record length marker is checked
+            header = f.read(4)
+    except (IOError, OSError):
+        return False
+    
+    if len(header) < 4:
+        return False
+    
+    # LFI files start with record length markers (Fortran unformatted)
+    # The first 4 bytes are typically a small integer (record length)
+    # This is not 100% reliable but helps for detection
+    first_int = int.from_bytes(header, byteorder='little')
+    
+    # FA files typically have a small initial record (< 1MB)
+    return 0 < first_int < 1_000_000
+
+
+def _open_dataset_raw(filename_or_obj, drop_variables=None, variables=None,
+                      stack_levels: bool = True, parallel: bool = False) -> xr.Dataset:
+    """
+    Open one FA file as a Dataset without the CF attributes.
+    
+    Multi-file openers use this per file and call _add_cf_attrs once on the
+    combined result instead.
+    """
+    # Use FADataset for consistent behavior with native API
+    from .core import FADataset
+    
+    fa = FADataset(filename_or_obj)
+    
+    # Convert variables list if provided
+    var_list = list(variables) if variables else None
+    
+    # Get the dataset using the same logic as native API
+    # (dropped variables are never read from the file)
+    ds = fa.to_xarray(variables=var_list, stack_levels=stack_levels,
+                      progress=False, parallel=parallel,
+                      drop_variables=list(drop_variables) if drop_variables else None)
+    
+    fa.close()
+    return ds
+
+
+def _add_cf_attrs(ds: xr.Dataset, source: str) -> xr.Dataset:
+    """Add CF-compliant global, lat/lon and per-variable attributes in place."""
+    ds.attrs.update(_CF_GLOBAL_ATTRS)
+    ds.attrs['source'] = source
+    
+    # Add coordinate attributes if not present
+    # Go through ds.variables (the underlying Variable objects) rather than
+    # ds['lat'], which builds a DataArray wrapper around the coordinate.
+    if 'lat' in ds.variables and 'units' not in ds.variables['lat'].attrs:
+        ds.variables['lat'].attrs.update(_LAT_ATTRS)
+    if 'lon' in ds.variables and 'units' not in ds.variables['lon'].attrs:
+        ds.variables['lon'].attrs.update(_LON_ATTRS)
     
-    return False
+    # Set coordinates attribute on each variable for CF compliance
+    # (on the Variable objects directly, again without DataArray wrappers)
+    for var in ds.data_vars.variables.values():
+        var.attrs['coordinates'] = 'lat lon'
+    return ds
 
 
 class FABackendEntrypoint(BackendEntrypoint):
@@ -86,11 +231,26 @@ class FABackendEntrypoint(BackendEntrypoint):
     xarray backend for FA files.
     
     This allows opening FA files directly with xr.open_dataset().
-    The backend is automatically registered when faxarray is imported.
+    xarray discovers it through the ``xarray.backends`` entry points
+    (engine names ``'faxarray'`` and ``'fa'``).
+    
+    Attributes
+    ----------
+    trust_extension : bool, default True
+        If True, ``guess_can_open`` accepts any path whose name looks like
+        an FA file (``.fa``/``.sfx`` extension or ``pf``/``PF``/``ICMSH``
+        prefix) without touching the filesystem, like the h5netcdf backend
+        does for its extensions. Set to False to require the path to exist
+        as a regular file before it is accepted.
     """
     
     description = "Open Météo-France FA files using faxarray"
-    open_dataset_parameters = ["filename_or_obj", "drop_variables", "variables", "stack_levels"]
+    # xarray only does membership tests on this, so a frozenset is enough
+    open_dataset_parameters = frozenset(
+        {"filename_or_obj", "drop_variables", "variables", "stack_levels",
+         "parallel"}
+    )
+    trust_extension: bool = True
     
     def open_dataset(
         self,
@@ -99,6 +259,7 @@ class FABackendEntrypoint(BackendEntrypoint):
         drop_variables: Optional[Iterable[str]] = None,
         variables: Optional[Iterable[str]] = None,
         stack_levels: bool = True,
+        parallel: bool = False,
     ) -> xr.Dataset:
         """
         Open an FA file as an xarray Dataset.
@@ -113,54 +274,17 @@ class FABackendEntrypoint(BackendEntrypoint):
             Variables to include (if None, includes all)
         stack_levels : bool, default True
             If True, stack 3D fields (S001TEMP, S002TEMP → TEMP(level, y, x))
+        parallel : bool, default False
+            If True, decode fields in a pool of worker processes
             
         Returns
         -------
         xarray.Dataset
         """
-        # Use FADataset for consistent behavior with native API
-        from .core import FADataset
-        
-        fa = FADataset(filename_or_obj)
-        
-        # Convert variables list if provided
-        var_list = list(variables) if variables else None
-        
-        # Get the dataset using the same logic as native API
-        ds = fa.to_xarray(variables=var_list, stack_levels=stack_levels, progress=False)
-        
-        # Drop variables if requested
-        if drop_variables:
-            ds = ds.drop_vars([v for v in drop_variables if v in ds.data_vars], errors='ignore')
-        
-        fa.close()
-        
-        # Add CF-compliant attributes
-        ds.attrs.update({
-            'source': str(filename_or_obj),
-            'Conventions': 'CF-1.8',
-            'institution': 'Météo-France',
-            'source_format': 'FA',
-        })
-        
-        # Add coordinate attributes if not present
-        if 'lat' in ds.coords and 'units' not in ds['lat'].attrs:
-            ds['lat'].attrs = {
-                'units': 'degrees_north',
-                'long_name': 'latitude',
-                'standard_name': 'latitude',
-            }
-        if 'lon' in ds.coords and 'units' not in ds['lon'].attrs:
-            ds['lon'].attrs = {
-                'units': 'degrees_east',
-                'long_name': 'longitude', 
-                'standard_name': 'longitude',
-            }
-        
-        # Set coordinates attribute on each variable for CF compliance
-        for var_name in ds.data_vars:
-            ds[var_name].attrs['coordinates'] = 'lat lon'
-        
+        ds = _open_dataset_raw(filename_or_obj, drop_variables=drop_variables,
+                               variables=variables, stack_levels=stack_levels,
+                               parallel=parallel)
+        _add_cf_attrs(ds, str(filename_or_obj))
         return ds
     
     def guess_can_open(self, filename_or_obj: str) -> bool:
@@ -168,23 +292,68 @@ class FABackendEntrypoint(BackendEntrypoint):
         Check if this backend can open the given file.
         
         This is called by xarray to auto-detect the correct backend.
+        xarray asks every registered backend, so anything that is clearly
+        not a local FA file (file objects, URLs, missing paths) is rejected
+        before ``is_fa_file`` is allowed to touch the file.
         """
+        if not isinstance(filename_or_obj, (str, os.PathLike)):
+            return False
         try:
-            if isinstance(filename_or_obj, str):
-                return is_fa_file(filename_or_obj)
+            path = os.fspath(filename_or_obj)
+            if not isinstance(path, str) or '://' in path:
+                return False
+            if self.trust_extension and _is_fa_by_name(path):
+                return True
+            # One stat() both rejects missing paths / non-regular files and
+            # keys the content probe cache
+            st = os.stat(path)
+            if not stat.S_ISREG(st.st_mode):
+                return False
+            return _is_fa_by_name(path) or _probe_fa(path, st.st_mtime_ns, st.st_size)
         except Exception:
             pass
         return False
 
 
-# Register with xarray
-def _register_backend():
-    """Register the FA backend with xarray."""
-    try:
-        # xarray 2022.03+ uses entry points, but we can also register manually
-        xr.backends.list_engines()  # Just to verify xarray is available
-    except Exception:
-        pass
+def _map_files(func: Callable, items: Iterable[Any], parallel: bool = False,
+               max_workers: Optional[int] = None) -> Iterator[Any]:
+    """
+    Yield ``func(item)`` for each item (file path or bytes), in input order.
+    
+    With ``parallel=True`` the calls run in a pool of worker processes
+    (``max_workers``, default one per CPU). EPyGrAM is not thread-safe, so
+    threads would only queue up on the reader. Items are consumed lazily and
+    at most one result per worker is kept waiting, so memory stays bounded
+    while the caller consumes results one by one.
+    """
+    if hasattr(items, '__len__') and len(items) < 2:
+        parallel = False
+    if not parallel:
+        for item in items:
+            yield func(item)
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import islice
+    import multiprocessing
+    
+    n_workers = max_workers or os.cpu_count() or 1
+    if hasattr(items, '__len__'):
+        n_workers = min(n_workers, len(items))
+    items = iter(items)
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as ex:
+        pending = deque(ex.submit(func, item) for item in islice(items, n_workers))
+        for item in items:
+            future = pending.popleft()
+            pending.append(ex.submit(func, item))
+            yield future.result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# The backend holds no per-file state, so one instance serves every call
+_BACKEND = FABackendEntrypoint()
 
 
 # Function to easily open FA files with xarray
@@ -205,8 +374,7 @@ def open_dataset(filename: str, **kwargs) -> xr.Dataset:
     -------
     xarray.Dataset
     """
-    backend = FABackendEntrypoint()
-    return backend.open_dataset(filename, **kwargs)
+    return _BACKEND.open_dataset(filename, **kwargs)
 
 
 def open_mfdataset(
@@ -214,9 +382,16 @@ def open_mfdataset(
     concat_dim: str = 'time',
     variables: list = None,
     deaccumulate: list = None,
-    chunk_hours: int = 1,
+    chunk_hours: Optional[int] = None,
     output_file: str = None,
     progress: bool = False,
+    parallel: bool = False,
+    dtype: str = 'float32',
+    lazy: Optional[bool] = None,
+    chunks: Optional[Dict[str, int]] = None,
+    max_workers: Optional[int] = None,
+    join: str = 'outer',
+    drop_page_cache: bool = False,
     **kwargs
 ) -> xr.Dataset:
     """
@@ -235,16 +410,61 @@ def open_mfdataset(
     deaccumulate : list of str, optional
         List of variable names to de-accumulate (convert from cumulative
         to hourly values). For these fields: hourly[t] = val[t] - val[t-1]
-    chunk_hours : int, default 1
-        Number of hours to hold in memory at once when streaming.
-        Lower values use less memory but may be slower.
+    chunk_hours : int, optional
+        Deprecated and ignored: streamed timesteps are written one at a
+        time, as soon as they are computed.
     output_file : str, optional
         If provided, stream results directly to this NetCDF file.
         This enables processing datasets larger than available memory.
     progress : bool, default False
         Print progress while loading files
+    parallel : bool, default False
+        Read files in a pool of worker processes (one file per CPU), like
+        xarray's ``open_mfdataset(parallel=True)``. De-accumulation and
+        writing still happen in file order. Scripts using this must guard
+        their entry point with ``if __name__ == '__main__':``.
+    dtype : {'float32', 'float64', 'int16'}, default 'float32'
+        Type of the de-accumulated fields. Differences are computed from the
+        original values and stored as float32 by default, which halves memory
+        and file size compared to float64. 'int16' also packs them on disk
+        with CF scale_factor=0.01 (e.g. 0.01 mm for precipitation, values
+        within +/-327); only use it for fields that fit that range.
+    lazy : bool, optional
+        If True, only read file headers up front (and decode the first file
+        once, to find the fields on the grid) and return dask-backed
+        fields: every field is read from its file when computed, and
+        de-accumulation becomes part of the dask graph. The result is the
+        same as with ``lazy=False``, except that a field which is not on
+        the grid in some file reads as NaN there instead of being dropped.
+        Files must stay in place until the data is computed.
+        Handles series larger than memory without streaming; with
+        ``output_file`` the result is written chunk by chunk.
+        Default: lazy when dask is installed and no ``output_file`` is
+        given (streamed writes read every file once, while lazy
+        de-accumulation reads each field for two timesteps).
+    chunks : dict, optional
+        Dask chunks of the lazy result, e.g. ``{'time': 4}``. By default
+        every field of every file is one chunk.
+    max_workers : int, optional
+        Number of worker processes with ``parallel=True`` (default: one
+        per CPU). Each worker holds one decoded file.
+    join : str, default 'outer'
+        How indexes (e.g. levels) are aligned across files, as in
+        ``xr.concat``. Time-invariant coordinates such as lat/lon are never
+        compared: all files of a series share one grid, so they are taken
+        from the first file (``coords='minimal', compat='override'``).
+        Not used with ``lazy=True``, where a field missing from a file
+        reads as NaN.
+    drop_page_cache : bool, default False
+        Once a file has been read, tell the kernel its pages may be dropped
+        from the page cache (``POSIX_FADV_DONTNEED``), so a long run over
+        multi-GB files does not evict other data. Leave it off if the files
+        are read again soon (e.g. a second pass): they then come from disk.
+        Not used with ``lazy=True``, where files are read when computed.
     **kwargs
-        Additional arguments passed to open_dataset
+        Additional arguments passed to open_dataset (``stack_levels``,
+        ``drop_variables``). Any other argument raises TypeError with
+        ``lazy=True``.
         
     Returns
     -------
@@ -268,27 +488,36 @@ def open_mfdataset(
     ...     deaccumulate=['SURFPREC.EAU.CON'],
     ...     output_file='output.nc')
     """
-    from glob import glob
-    import re
-    
     # Handle glob pattern or list of files
+    # Sort by forecast hour (extract from filename like +0001, +0024)
     if isinstance(paths, str):
-        file_list = sorted(glob(paths))
+        file_list = _expand_pattern(paths)
         if not file_list:
             raise FileNotFoundError(f"No files found matching pattern: {paths}")
+        # Ties (no hour suffix) fall back to the file name
+        file_list.sort(key=lambda p: (_extract_hour(p), p))
     else:
         file_list = list(paths)
+        file_list.sort(key=_extract_hour)
     
-    # Sort by forecast hour (extract from filename like +0001, +0024)
-    def extract_hour(filepath):
-        match = re.search(r'\+(\d{4})$', filepath)
-        return int(match.group(1)) if match else 0
-    
-    file_list = sorted(file_list, key=extract_hour)
+    if chunk_hours is not None:
+        warnings.warn(
+            "open_mfdataset(chunk_hours=...) is deprecated and ignored: "
+            "streamed timesteps are always written one at a time",
+            FutureWarning, stacklevel=2,
+        )
     
     if deaccumulate and len(file_list) < 2:
         raise ValueError("Need at least 2 files for de-accumulation")
     
+    if dtype not in _DEACCUM_ENCODINGS:
+        raise ValueError(
+            f"dtype must be one of {sorted(_DEACCUM_ENCODINGS)}, got {dtype!r}"
+        )
+    # In-memory type of de-accumulated fields and their NetCDF encoding
+    out_dtype = np.float64 if dtype == 'float64' else np.float32
+    deaccum_encoding = _DEACCUM_ENCODINGS[dtype]
+    
     if progress:
         print(f"Processing {len(file_list)} FA files...")
         if deaccumulate:
@@ -296,91 +525,163 @@ def open_mfdataset(
     
     deaccumulate = deaccumulate or []
     
-    # Process in chunks
-    result_datasets = []
-    prev_ds = None
+    # Normalize deaccumulate list (handle both SURFPREC.EAU.CON and SURFPREC_EAU_CON).
+    # A dict keeps the user's order for the per-file intersection below.
+    deaccum_normalized = {}
+    for name in deaccumulate:
+        deaccum_normalized[name] = None
+        deaccum_normalized[name.replace('.', '_')] = None
     
-    for i, filepath in enumerate(file_list):
-        if progress:
-            hour = extract_hour(filepath)
-            print(f"  [{i+1}/{len(file_list)}] Loading +{hour:04d}...")
-        
-        # Load current file (with optional variable filtering for memory efficiency)
-        ds = open_dataset(filepath, variables=variables, **kwargs)
-        
-        # Handle first file differently based on whether we're de-accumulating
-        if i == 0:
-            if deaccumulate:
-                # Keep as baseline for de-accumulation
-                prev_ds = ds
+    # 'source' attribute of the result
+    source = paths if isinstance(paths, str) else str(file_list[0])
+    
+    if lazy is None:
+        from .core import HAS_DASK
+        lazy = HAS_DASK and output_file is None
+    
+    if lazy:
+        unsupported = set(kwargs) - {'stack_levels', 'drop_variables'}
+        if unsupported:
+            raise TypeError(
+                f"open_mfdataset(lazy=True) does not support {sorted(unsupported)}"
+            )
+        return _open_mfdataset_lazy(
+            file_list, concat_dim, variables, deaccum_normalized,
+            out_dtype, deaccum_encoding, output_file, progress, parallel,
+            max_workers, chunks, stack_levels=kwargs.get('stack_levels', True),
+            drop_variables=kwargs.get('drop_variables'), source=source,
+        )
+    
+    # One output timestep per file, minus the baseline when de-accumulating.
+    # In memory each timestep goes to its own slot; streamed timesteps are
+    # written right away and never collected.
+    first_step = 1 if deaccumulate else 0
+    result_datasets = None if output_file else [None] * (len(file_list) - first_step)
+    
+    # Raw (cumulative) values of the fields to de-accumulate. In memory they
+    # are collected into one (file, ...) array per field and differenced in
+    # a single vectorized step after the loop; when streaming, only the
+    # previous file's values are kept.
+    stacks = {}       # name -> array of shape (n_files, ...)
+    templates = {}    # name -> (dims, attrs) of the per-timestep field
+    prev_raw = {}
+    hourly_buffers = {}  # name -> output buffer reused across streamed timesteps
+    
+    # Load files (with optional variable filtering for memory efficiency).
+    # Reads may run ahead in worker processes; results arrive in file order.
+    # CF attributes are added once to the result, not to every file.
+    load = functools.partial(_open_dataset_raw, variables=variables, **kwargs)
+    
+    # Streaming writes keep one NetCDF handle open for the whole run
+    appender = _NetCDFAppender(output_file, concat_dim) if output_file else None
+    
+    try:
+        for i, (filepath, ds) in enumerate(zip(file_list, _map_files(load, file_list, parallel, max_workers))):
+            if progress:
+                hour = _extract_hour(filepath)
+                print(f"  [{i+1}/{len(file_list)}] Loaded +{hour:04d}")
+            
+            # One timestep: squeeze turns the singleton time dimension into
+            # a scalar coordinate, for the fields and coordinates alike
+            ds = ds.squeeze()
+            
+            # Fields to de-accumulate that this file actually has; only
+            # these are looked at, however many variables the file holds
+            deaccum_present = [name for name in deaccum_normalized if name in ds.data_vars]
+            
+            # Cumulative values in this file
+            raw = {}
+            for var_name in deaccum_present:
+                field = ds[var_name]
+                templates.setdefault(var_name, (field.dims, field.attrs))
+                # .data: the numpy array itself, not a copy
+                raw[var_name] = field.data
+            
+            hourly = {}
+            if output_file:
+                # Streaming: de-accumulate against the previous file right away
+                for var_name, curr_data in raw.items():
+                    if var_name not in prev_raw:
+                        continue
+                    # Each timestep is written before the next one is
+                    # computed, so one buffer per field is enough
+                    out = hourly_buffers.get(var_name)
+                    if out is None or out.shape != curr_data.shape:
+                        out = hourly_buffers[var_name] = np.empty(curr_data.shape, out_dtype)
+                    # Computed in the input precision, rounded on store
+                    hourly[var_name] = np.subtract(curr_data, prev_raw[var_name], out=out)
+                prev_raw = raw
+            else:
+                for var_name, curr_data in raw.items():
+                    if var_name not in stacks:
+                        # NaN marks files where the field is missing
+                        stacks[var_name] = np.full((len(file_list),) + curr_data.shape, np.nan)
+                    stacks[var_name][i] = curr_data
+            
+            # First file is only the baseline when de-accumulating
+            if i == 0 and deaccumulate:
+                del ds
+                if drop_page_cache:
+                    _release_file_cache(filepath)
                 continue
+            
+            if deaccumulate:
+                # Create output dataset for this timestep
+                result_vars = {}
+                
+                # De-accumulated fields first. In memory they are all
+                # de-accumulated at once after the loop and skipped here.
+                for var_name in deaccum_present:
+                    if var_name in hourly:
+                        dims, attrs = templates[var_name]
+                        result_vars[var_name] = xr.DataArray(hourly[var_name], dims=dims, attrs=attrs)
+                        result_vars[var_name].encoding.update(deaccum_encoding)
+                    elif output_file:
+                        # No previous value to difference against
+                        result_vars[var_name] = ds[var_name]
+                
+                # Everything else is kept as-is, in file order so the
+                # output variable order is stable
+                skip = set(deaccum_present)
+                for var_name in ds.data_vars:
+                    if var_name not in skip:
+                        result_vars[var_name] = ds[var_name]
+                
+                # Time stays a scalar coordinate here; the append or concat
+                # turns it into the dimension of every field
+                timestep_ds = xr.Dataset(result_vars, coords=ds.coords, attrs=ds.attrs)
+                del result_vars
             else:
-                # No de-accumulation, process all files including first
-                pass
-        
-        # Create output dataset for this timestep
-        result_vars = {}
-        
-        # Normalize deaccumulate list (handle both SURFPREC.EAU.CON and SURFPREC_EAU_CON)
-        deaccum_normalized = set()
-        for name in deaccumulate:
-            deaccum_normalized.add(name)
-            deaccum_normalized.add(name.replace('.', '_'))
-        
-        for var_name in ds.data_vars:
-            if var_name in deaccum_normalized and prev_ds is not None:
-                # De-accumulate: hourly = current - previous
-                if var_name in prev_ds.data_vars:
-                    # Use .values to avoid coordinate alignment issues (time dim)
-                    curr_data = ds[var_name].values
-                    prev_data = prev_ds[var_name].values
-                    hourly_data = curr_data - prev_data
-                    # Create new DataArray with current file's structure (without time dim issues)
-                    result_vars[var_name] = xr.DataArray(
-                        hourly_data.squeeze(),  # Remove singleton dimensions
-                        dims=['y', 'x'] if hourly_data.squeeze().ndim == 2 else ds[var_name].squeeze().dims,
-                        attrs=ds[var_name].attrs
-                    )
-                else:
-                    result_vars[var_name] = ds[var_name].squeeze()
+                # Pure passthrough: the file's dataset is the timestep
+                timestep_ds = ds
+            
+            # If streaming to file, write immediately (don't accumulate)
+            if output_file:
+                if i == first_step:
+                    # The first write defines the file's attributes
+                    _add_cf_attrs(timestep_ds, source)
+                appender.append([timestep_ds], progress)
             else:
-                # Keep as-is (squeeze to remove singleton time dim)
-                result_vars[var_name] = ds[var_name].squeeze()
-        
-        # Create dataset for this timestep
-        timestep_ds = xr.Dataset(result_vars, coords=ds.coords, attrs=ds.attrs)
-        
-        # If streaming to file, write immediately (don't accumulate)
-        if output_file:
-            _append_to_netcdf([timestep_ds], output_file, concat_dim, progress)
+                result_datasets[i - first_step] = timestep_ds
             # Clear memory immediately
             del timestep_ds
-            del result_vars
-        else:
-            result_datasets.append(timestep_ds)
-            # If in-memory mode and we've accumulated enough chunks
-            if len(result_datasets) >= chunk_hours:
-                # Keep for later concat (in-memory mode)
-                pass
-        
-        # Only keep prev_ds if we're doing de-accumulation
-        if deaccumulate:
-            # Release old prev_ds memory before assigning new one
-            if prev_ds is not None and prev_ds is not ds:
-                del prev_ds
-            prev_ds = ds
-        else:
-            # No de-accumulation - don't keep any reference
+            
+            # No reference to the file's dataset is kept beyond this point;
+            # reference counting frees its arrays right away
             del ds
-        
-        # Force garbage collection periodically
-        import gc
-        gc.collect()
+            
+            # Each file is read exactly once: its pages can be dropped from
+            # the page cache so long runs don't evict other data
+            if drop_page_cache:
+                _release_file_cache(filepath)
+    except BaseException:
+        if appender is not None:
+            appender.close()
+        raise
     
-    # Handle remaining datasets
     if output_file:
-        if result_datasets:
-            _append_to_netcdf(result_datasets, output_file, concat_dim, progress)
+        # Every timestep has been written already
+        appender.close()
         if progress:
             print(f"Done! Saved to {output_file}")
         # Return the written file as dataset
@@ -390,7 +691,17 @@ def open_mfdataset(
         if progress:
             print(f"Concatenating {len(result_datasets)} timesteps...")
         
-        combined = xr.concat(result_datasets, dim=concat_dim, data_vars='all')
+        combined = _combine_timesteps(result_datasets, concat_dim, join)
+        
+        # De-accumulate every timestep at once: hourly[t] = val[t] - val[t-1]
+        for var_name, stack in stacks.items():
+            dims, attrs = templates[var_name]
+            hourly = np.subtract(stack[1:], stack[:-1],
+                                 out=np.empty((len(stack) - 1,) + stack.shape[1:], out_dtype))
+            combined[var_name] = ((concat_dim,) + dims, hourly, attrs)
+            combined[var_name].encoding.update(deaccum_encoding)
+        
+        _add_cf_attrs(combined, source)
         
         if progress:
             print(f"Done! Shape: {dict(combined.sizes)}")
@@ -398,69 +709,359 @@ def open_mfdataset(
         return combined
 
 
-def _append_to_netcdf(datasets: list, filepath: str, dim: str, progress: bool = False):
+def _combine_timesteps(datasets: list, concat_dim: str, join: str = 'outer') -> xr.Dataset:
+    """
+    Concatenate per-file datasets of one series along concat_dim.
+    
+    All files share one grid, so time-invariant coordinates are taken from
+    the first dataset instead of being loaded and compared file by file.
+    Fields are only concatenated along an existing dimension ('minimal')
+    when every field of every dataset has it; otherwise they are all
+    stacked, so that no field is taken from the first dataset alone.
+    """
+    if len(datasets) == 1:
+        # Nothing to combine: just give every field the dimension (no data
+        # is copied or loaded)
+        return _with_dim(datasets[0], concat_dim)
+    
+    if all(concat_dim in var.dims
+           for ds in datasets for var in ds.data_vars.values()):
+        data_vars = 'minimal'
+    else:
+        data_vars = 'all'
+    return xr.combine_nested(datasets, concat_dim=concat_dim, join=join,
+                             data_vars=data_vars, coords='minimal',
+                             compat='override', combine_attrs='override')
+
+
+def _read_header(filepath: str) -> Tuple[Tuple[str, ...], Dict[str, Any]]:
+    """Field names and validity (see FAReader.get_validity) of one FA file."""
+    reader = FAReader(filepath)
+    try:
+        return tuple(reader.fields), reader.get_validity()
+    finally:
+        reader.close()
+
+
+def _warn_inconsistent(var_sets: list):
+    """Print a warning for every file whose variables differ from the first."""
+    first_vars = var_sets[0]
+    for i, current_vars in enumerate(var_sets[1:]):
+        if current_vars != first_vars:
+            missing = first_vars - current_vars
+            extra = current_vars - first_vars
+            msg = f"Inconsistent variables in file {i+2}."
+            if missing: msg += f" Missing: {missing}."
+            if extra: msg += f" Extra: {extra}."
+            print(f"WARNING: {msg}")
+            # We could raise an error here if strictness is required
+
+
+def _open_lazy_series(filepaths: list, headers: list, variables=None,
+                      stack_levels: bool = True, concat_dim: str = 'time',
+                      drop_variables=None) -> xr.Dataset:
     """
-    Append datasets to NetCDF file using netCDF4-python for memory efficiency.
+    Build one dask-backed Dataset for a series of FA files.
+    
+    Only the headers (from _read_header) are needed per file: grid and
+    variable layout come from the first file, and every variable is built
+    directly as one dask array over all files, with one delayed read per
+    field and file. No per-file Dataset is built and nothing has to be
+    concatenated.
     
-    Uses true incremental write - never loads the existing file into memory.
+    The result matches what the eager readers build file by file and
+    concatenate: without ``variables``, only the fields of the first file
+    that decode on the grid are kept (that file is decoded once to find
+    them), ``drop_variables`` are left out, and the attributes and time
+    encoding are the same. A field that is missing or off-grid in a later
+    file reads as NaN there (missing ones are reported); errors reading a
+    file are raised when the data is computed.
     """
-    import os
-    import netCDF4 as nc
-    import numpy as np
+    import dask.array as da
+    from dask import delayed
+    from .core import (FADataset, _TIME_ATTRS, _TIME_ENCODING, _build_dataset,
+                       _dataset_var_names, _detect_3d_fields_cached,
+                       _read_field_or_nan, _time_values, _validity_attrs)
     
-    combined = xr.concat(datasets, dim=dim, data_vars='all')
+    wanted = set(variables) if variables else None
     
-    if os.path.exists(filepath):
-        # TRUE APPEND using netCDF4 directly (memory efficient)
+    def selected(fields):
+        if wanted is not None:
+            return tuple(f for f in fields if f in wanted)
+        return fields
+    
+    candidates = selected(headers[0][0])
+    excluded = set()
+    if drop_variables:
+        drop_set = set(drop_variables)
+        var_names = _dataset_var_names(list(candidates), stack_levels)
+        excluded = {f for f in candidates if var_names[f] in drop_set}
+    
+    template = FADataset(filepaths[0])
+    try:
+        shape = template.shape
+        lat, lon = template.lat, template.lon
+        if wanted is None:
+            # Like FADataset.load: only fields that decode on the grid
+            on_grid = template._reader.read_all_fields(filter_shape=shape,
+                                                       skip=excluded)
+            excluded.update(f for f in candidates if f not in on_grid)
+            del on_grid
+    finally:
+        template.close()
+    
+    fields = tuple(f for f in candidates if f not in excluded)
+    var_names = _dataset_var_names(list(fields), stack_levels)
+    present = [set(selected(h[0])) - excluded for h in headers]
+    _warn_inconsistent([
+        {var_names.get(f, f.replace('.', '_')) for f in p} for p in present
+    ])
+    
+    read_field = delayed(_read_field_or_nan)
+    
+    def read(path, file_fields, name):
+        if name in file_fields:
+            return da.from_delayed(read_field(path, name, shape), shape=shape,
+                                   dtype=np.float64)
+        return da.full(shape, np.nan, chunks=shape)
+    
+    def series(names):
+        # (file, [level,] y, x) array of the given fields
+        per_file = []
+        for path, file_fields in zip(filepaths, present):
+            levels = [read(path, file_fields, name) for name in names]
+            per_file.append(da.stack(levels) if len(levels) > 1 else levels[0])
+        return da.stack(per_file)
+    
+    data_vars = {}
+    level_coords = {}
+    processed_fields = set()
+    if stack_levels:
+        for base_name, group_info in _detect_3d_fields_cached(fields).items():
+            level_nums = [lvl for lvl, _ in group_info['levels']]
+            field_names = [name for _, name in group_info['levels']]
+            dim_name = 'level' if group_info['type'] == 'model' else 'pressure'
+            data_vars[base_name.replace('.', '_')] = xr.Variable(
+                (concat_dim, dim_name, 'y', 'x'),
+                series(field_names),
+                {
+                    'level_values': level_nums,
+                    'level_type': group_info['type'],
+                    'original_fields': field_names,
+                }
+            )
+            if dim_name not in level_coords:
+                level_coords[dim_name] = {
+                    'values': np.array(level_nums, dtype=np.int32),
+                    'attrs': {
+                        'long_name': 'model level' if dim_name == 'level' else 'pressure',
+                        'units': group_info['units'],
+                        'positive': group_info['positive'],
+                    }
+                }
+            processed_fields.update(field_names)
+    
+    for name in fields:
+        if name not in processed_fields:
+            data_vars[name.replace('.', '_')] = xr.Variable(
+                (concat_dim, 'y', 'x'), series([name]))
+    
+    ds = _build_dataset(data_vars, lat, lon, level_coords,
+                        _validity_attrs(headers[0][1]))
+    
+    valid_times = [h[1]['valid_time'] for h in headers]
+    if all(t is not None for t in valid_times):
+        ds = ds.assign_coords(time=xr.Variable((concat_dim,), _time_values(valid_times),
+                                               dict(_TIME_ATTRS)))
+        ds.variables['time'].encoding = dict(_TIME_ENCODING)
+    return ds
+
+
+def _open_mfdataset_lazy(file_list, concat_dim, variables, deaccum_names,
+                         out_dtype, deaccum_encoding, output_file, progress,
+                         parallel, max_workers=None, chunks=None,
+                         stack_levels=True, drop_variables=None,
+                         source='') -> xr.Dataset:
+    """
+    Lazy version of open_mfdataset: dask-backed fields.
+    
+    Only file headers are read, plus the first file once to find the
+    fields on the grid (see _open_lazy_series), so computing a field only
+    reads that field.
+    """
+    # Headers can be read ahead in worker processes; order is preserved
+    headers = []
+    for i, header in enumerate(_map_files(_read_header, file_list, parallel, max_workers)):
+        headers.append(header)
+        if progress:
+            print(f"  [{i+1}/{len(file_list)}] Opened +{_extract_hour(file_list[i]):04d}")
+    
+    combined = _open_lazy_series(file_list, headers, variables, stack_levels,
+                                 concat_dim, drop_variables)
+    
+    if chunks:
+        combined = combined.chunk(chunks)
+    
+    if deaccum_names:
+        # hourly[t] = val[t] - val[t-1], labelled with t; the first
+        # timestep is only the baseline
+        hourly = {}
+        for var_name in deaccum_names:
+            if var_name in combined.data_vars:
+                field = combined[var_name]
+                hourly[var_name] = (field.diff(concat_dim, label='upper')
+                                    .astype(out_dtype).assign_attrs(field.attrs))
+                hourly[var_name].encoding.update(deaccum_encoding)
+        combined = combined.isel({concat_dim: slice(1, None)})
+        combined = combined.assign(hourly)
+        # As in the eager path, the first output timestep sets the attributes
+        from .core import _validity_attrs
+        combined.attrs.update(_validity_attrs(headers[1][1]))
+    del headers
+    
+    _add_cf_attrs(combined, source)
+    
+    if output_file:
+        if progress:
+            print(f"  Writing {combined.sizes[concat_dim]} timesteps to {output_file}...")
+        # dask computes and writes one chunk at a time
+        combined.to_netcdf(output_file, unlimited_dims=[concat_dim],
+                           encoding=_slab_encoding(combined, concat_dim))
         if progress:
-            print(f"    Appending {len(datasets)} timesteps to {filepath}...")
+            print(f"Done! Saved to {output_file}")
+        return xr.open_dataset(output_file)
+    
+    if progress:
+        print(f"Done! Shape: {dict(combined.sizes)}")
+    return combined
+
+
+def _with_dim(ds: xr.Dataset, dim: str) -> xr.Dataset:
+    """
+    Give every data variable of a single timestep the dimension ``dim``.
+    
+    A scalar ``dim`` coordinate is promoted to a length-1 dimension. If
+    ``dim`` already is a dimension, the data variables lacking it are
+    expanded. No data is copied either way.
+    """
+    if dim not in ds.dims:
+        return ds.expand_dims(dim)
+    missing = [name for name, var in ds.data_vars.items() if dim not in var.dims]
+    if not missing:
+        return ds
+    return ds.assign({name: ds[name].expand_dims(dim) for name in missing})
+
+
+class _NetCDFAppender:
+    """
+    Append datasets to a NetCDF file along an unlimited dimension.
+    
+    The file is created through xarray on the first write (or opened if it
+    already exists); after that one netCDF4 handle stays open and every
+    append only extends the time axis - the existing file is never loaded
+    into memory, and there is no open/close cycle per timestep.
+    Call close() when done.
+    
+    Fields are stored uncompressed in one chunk per 2D slab, so every
+    append writes whole chunks and never has to read back a partially
+    filled one.
+    """
+    
+    def __init__(self, filepath: str, dim: str):
+        self.filepath = filepath
+        self.dim = dim
+        self._ncfile = None
+    
+    def append(self, datasets: list, progress: bool = False):
+        """Append one or more datasets (in order) to the file."""
+        import netCDF4 as nc
         
-        with nc.Dataset(filepath, mode='a') as ncfile:
-            # Get current time dimension size
-            time_var = ncfile.variables[dim]
-            current_len = len(time_var)
-            new_len = current_len + combined.sizes[dim]
-            
-            # Extend time coordinate
-            if dim in combined.coords:
-                time_values = combined[dim].values
-                # Handle numpy datetime64 - convert to match file's time units
-                if np.issubdtype(time_values.dtype, np.datetime64):
-                    # Get the time units from the file
-                    time_units = getattr(time_var, 'units', 'hours since 1970-01-01')
-                    from cftime import date2num
-                    import pandas as pd
-                    # Convert numpy datetime64 to python datetime
-                    datetimes = pd.to_datetime(time_values).to_pydatetime()
-                    calendar = getattr(time_var, 'calendar', 'proleptic_gregorian')
-                    time_values = date2num(datetimes, time_units, calendar=calendar)
-                time_var[current_len:new_len] = time_values
+        dim = self.dim
+        if len(datasets) == 1:
+            # Common streaming case: no concat, just give every field the
+            # length-1 time dimension (no data copy)
+            combined = _with_dim(datasets[0], dim)
+        else:
+            combined = xr.concat(datasets, dim=dim, data_vars='all')
+        
+        if self._ncfile is None and not os.path.exists(self.filepath):
+            # Create new file with unlimited time dimension
+            if progress:
+                print(f"    Writing {len(datasets)} timesteps to {self.filepath}...")
             
-            # Append each variable
-            for var_name in combined.data_vars:
-                if var_name in ncfile.variables:
-                    var = ncfile.variables[var_name]
-                    data = combined[var_name].values
-                    
-                    # Find which axis is the time dimension
-                    var_dims = var.dimensions
-                    if dim in var_dims:
-                        time_axis = var_dims.index(dim)
-                        # Build slice for appending along time axis
-                        slices = [slice(None)] * len(var_dims)
-                        slices[time_axis] = slice(current_len, new_len)
-                        var[tuple(slices)] = data
-    else:
-        # Create new file with unlimited time dimension
+            # Use xarray to create initially, but set time as unlimited
+            combined.to_netcdf(self.filepath, unlimited_dims=[dim],
+                               encoding=_slab_encoding(combined, dim))
+            return
+        
+        # TRUE APPEND using netCDF4 directly (memory efficient)
         if progress:
-            print(f"    Writing {len(datasets)} timesteps to {filepath}...")
+            print(f"    Appending {len(datasets)} timesteps to {self.filepath}...")
         
-        # Use xarray to create initially, but set time as unlimited
-        combined.to_netcdf(filepath, unlimited_dims=[dim])
-
-
+        if self._ncfile is None:
+            self._ncfile = nc.Dataset(self.filepath, mode='a')
+        ncfile = self._ncfile
+        
+        # Get current time dimension size
+        time_var = ncfile.variables[dim]
+        current_len = len(time_var)
+        new_len = current_len + combined.sizes[dim]
+        
+        # Extend time coordinate
+        if dim in combined.coords:
+            time_values = combined[dim].values
+            # Handle numpy datetime64 - convert to match file's time units
+            if np.issubdtype(time_values.dtype, np.datetime64):
+                # Get the time units from the file
+                time_units = getattr(time_var, 'units', 'hours since 1970-01-01')
+                from cftime import date2num
+                import pandas as pd
+                # Convert numpy datetime64 to python datetime
+                datetimes = pd.to_datetime(time_values).to_pydatetime()
+                calendar = getattr(time_var, 'calendar', 'proleptic_gregorian')
+                time_values = date2num(datetimes, time_units, calendar=calendar)
+            time_var[current_len:new_len] = time_values
+        
+        # Append each variable
+        for var_name in combined.data_vars:
+            if var_name in ncfile.variables:
+                var = ncfile.variables[var_name]
+                data = combined[var_name].values
+                if hasattr(var, 'scale_factor'):
+                    # Packed variable: NaNs must become the fill value
+                    data = np.ma.masked_invalid(data)
+                
+                # Find which axis is the time dimension
+                var_dims = var.dimensions
+                if dim in var_dims:
+                    time_axis = var_dims.index(dim)
+                    # Build slice for appending along time axis
+                    slices = [slice(None)] * len(var_dims)
+                    slices[time_axis] = slice(current_len, new_len)
+                    var[tuple(slices)] = data
+    
+    def close(self):
+        """Close the underlying netCDF4 handle (if open)."""
+        if self._ncfile is not None:
+            self._ncfile.close()
+            self._ncfile = None
 
 
+def _slab_encoding(ds: xr.Dataset, dim: str) -> Dict[str, Dict[str, Any]]:
+    """
+    NetCDF encoding storing each (y, x) slab of a time-dependent field as
+    one uncompressed chunk, e.g. chunksizes=(1, ny, nx) for (time, y, x).
+    """
+    encoding = {}
+    for var_name, var in ds.data_vars.items():
+        if dim not in var.dims or var.ndim < 3:
+            continue
+        encoding[var_name] = {
+            **var.encoding,
+            'chunksizes': (1,) * (var.ndim - 2) + var.shape[-2:],
+            'zlib': False,
+        }
+    return encoding
 
 
 class TarDataset(xr.Dataset):
@@ -473,7 +1074,17 @@ class TarDataset(xr.Dataset):
     __slots__ = ('_temp_dir', '_cleanup')
     
     def __init__(self, ds: xr.Dataset, temp_dir: str, cleanup: bool = True):
-        super().__init__(ds)
+        # Take over ds's internals directly (as Dataset._construct_direct
+        # does) instead of re-merging every variable through
+        # Dataset.__init__: no Variable copies, no coordinate validation.
+        # ds itself should not be used afterwards.
+        self._variables = ds._variables
+        self._coord_names = ds._coord_names
+        self._dims = ds._dims
+        self._indexes = ds._indexes
+        self._attrs = ds._attrs
+        self._encoding = ds._encoding
+        self._close = None
         self._temp_dir = temp_dir
         self._cleanup = cleanup
         self.set_close(self._close_callback)
@@ -485,55 +1096,154 @@ class TarDataset(xr.Dataset):
             shutil.rmtree(self._temp_dir, ignore_errors=True)
 
 
-def _read_single_file(filepath: str, variables=None, stack_levels=True, lazy=False) -> xr.Dataset:
-    """Helper to read a single FA file."""
+# Regular-file members of recently read archives, keyed by
+# (path, mtime, size): repeated open_tar calls on one archive (exploring it
+# pattern by pattern) don't have to walk or decompress it all again.
+_TAR_INDEX_CACHE: Dict[Tuple[str, int, int], list] = {}
+_TAR_INDEX_CACHE_SIZE = 4
+
+
+def _is_plain_tar(tarpath) -> bool:
+    """Whether an archive is an uncompressed (seekable) tar, by name."""
+    return str(tarpath).lower().endswith('.tar')
+
+
+def _tar_index_key(tarpath) -> Optional[Tuple[str, int, int]]:
+    try:
+        st = os.stat(tarpath)
+    except OSError:
+        return None
+    return (os.path.abspath(tarpath), st.st_mtime_ns, st.st_size)
+
+
+def _iter_tar_files(tar, tarpath, match: Callable[[str], bool]) -> Iterator[Any]:
+    """
+    Yield the regular-file members of an open archive whose name matches.
+    
+    The first full pass over an archive records its file members. Later
+    calls pick the matches from that index: a plain tar then seeks straight
+    to them, and a compressed stream is only read up to the last match.
+    """
+    key = _tar_index_key(tarpath)
+    index = _TAR_INDEX_CACHE.get(key) if key is not None else None
+    
+    if index is not None:
+        wanted = [member for member in index if match(member.name)]
+        if _is_plain_tar(tarpath):
+            yield from wanted
+            return
+        remaining = {member.name for member in wanted}
+        if not remaining:
+            return
+        for member in tar:
+            if member.isfile() and member.name in remaining:
+                yield member
+                remaining.discard(member.name)
+                if not remaining:
+                    # The rest of the archive is never decompressed
+                    return
+        return
+    
+    files = []
+    for member in tar:
+        if not member.isfile():
+            continue
+        files.append(member)
+        if match(member.name):
+            yield member
+    
+    # Only a complete pass gives a usable index
+    if key is not None:
+        if len(_TAR_INDEX_CACHE) >= _TAR_INDEX_CACHE_SIZE:
+            _TAR_INDEX_CACHE.pop(next(iter(_TAR_INDEX_CACHE)))
+        _TAR_INDEX_CACHE[key] = files
+
+
+@contextlib.contextmanager
+def _open_tar_archive(tarpath: str, parallel_extract: bool = True):
+    """
+    Open a tar archive for a single forward pass over its members.
+    
+    Plain tars are opened seekable so unmatched members are skipped with a
+    seek; compressed ones are read as a forward-only stream (the single
+    pass never needs to go back). Gzipped archives are piped through
+    ``pigz -dc`` when ``parallel_extract`` is set and pigz is installed.
+    """
+    import shutil
+    import subprocess
+    import tarfile
+    
+    name = str(tarpath).lower()
+    if _is_plain_tar(tarpath):
+        with tarfile.open(tarpath, 'r:') as tar:
+            yield tar
+        return
+    
+    pigz = shutil.which('pigz') if parallel_extract else None
+    if pigz is None or not name.endswith(('.tar.gz', '.tgz')):
+        with tarfile.open(tarpath, 'r|*') as tar:
+            yield tar
+        return
+    
+    proc = subprocess.Popen([pigz, '-dc', str(tarpath)], stdout=subprocess.PIPE)
+    stopped_early = True
+    try:
+        with tarfile.open(fileobj=proc.stdout, mode='r|') as tar:
+            yield tar
+        # Still running: the reader stopped before the end of the archive
+        stopped_early = proc.poll() is None
+    finally:
+        if stopped_early:
+            proc.kill()
+        proc.stdout.close()
+        returncode = proc.wait()
+    if not stopped_early and returncode != 0:
+        raise OSError(f"pigz failed to decompress {tarpath} (exit code {returncode})")
+
+
+def _read_single_file(filepath, variables=None, stack_levels=True) -> xr.Dataset:
+    """Helper to read a single FA file (path, bytes or file object) eagerly."""
     from .core import FADataset
     
     fa = FADataset(filepath)
     try:
-        if lazy:
-            # Lazy loading - dask arrays
-            ds = fa.to_xarray_lazy(variables=variables, stack_levels=stack_levels)
-        else:
-            # Eager loading
-            var_list = list(variables) if variables else None
-            ds = fa.to_xarray(variables=var_list, stack_levels=stack_levels)
-        
-        # Add CF-compliant attributes
-        ds.attrs.update({
-            'source': str(filepath),
-            'Conventions': 'CF-1.8',
-            'institution': 'Météo-France',
-            'source_format': 'FA',
-        })
-        
-        return ds
+        var_list = list(variables) if variables else None
+        # CF attributes are added by the caller, once for all files
+        return fa.to_xarray(variables=var_list, stack_levels=stack_levels)
     finally:
-        if not lazy:
-            fa.close()
+        fa.close()
 
 
 def open_tar(
     tarpath: str,
-    temp_dir: str,
+    temp_dir: Optional[str] = None,
     pattern: str = '*',
     concat_dim: str = 'time',
     variables: list = None,
     progress: bool = False,
+    parallel: bool = False,
+    lazy: bool = True,
+    max_workers: Optional[int] = None,
+    join: str = 'exact',
+    parallel_extract: bool = True,
     **kwargs
-) -> TarDataset:
+) -> xr.Dataset:
     """
     Open FA files from a tar archive.
     
-    Extracts FA files to a temporary directory and reads them using lazy loading.
-    Data is loaded on demand when accessed.
+    By default, extracts FA files to a temporary directory and reads them
+    using lazy loading. Data is loaded on demand when accessed.
+    
+    With ``lazy=False`` the matching members are streamed straight out of
+    the archive and loaded into memory one at a time instead, so nothing is
+    extracted and no temporary directory has to be managed.
     
     Parameters
     ----------
     tarpath : str
         Path to the tar archive (.tar, .tar.gz, .tgz)
-    temp_dir : str
-        Directory to extract files to. Required.
+    temp_dir : str, optional
+        Directory to extract files to. Required when ``lazy=True``.
     pattern : str, default '*'
         Glob pattern to filter files within the archive (e.g., '*+000*')
     concat_dim : str, default 'time'
@@ -542,21 +1252,45 @@ def open_tar(
         Specific variables to load (reduces memory usage)
     progress : bool, default False
         Print progress messages
+    parallel : bool, default False
+        Open the files in a pool of worker processes (see
+        ``open_mfdataset``) while the archive is still being read.
+    lazy : bool, default True
+        If True, extract to ``temp_dir`` and return dask-backed data.
+        If False, read the members directly from the archive into memory.
+    max_workers : int, optional
+        Number of worker processes with ``parallel=True`` (default: one
+        per CPU)
+    join : str, default 'exact'
+        How indexes (e.g. levels) are aligned across files. 'exact' raises
+        on any mismatch instead of silently padding with NaN. Lat/lon are
+        taken from the first file without comparison (see open_mfdataset).
+        Only used with ``lazy=False``; lazily, a field missing from a file
+        is reported and reads as NaN.
+    parallel_extract : bool, default True
+        Decompress gzipped archives (.tar.gz, .tgz) with the multi-threaded
+        ``pigz`` tool when it is installed, instead of Python's single-
+        threaded gzip module.
     **kwargs
         Additional arguments passed to the backend
         
     Returns
     -------
-    TarDataset
-        Combined dataset. Call `ds.close()` when done to cleanup temp files.
+    TarDataset or xarray.Dataset
+        Combined dataset. With ``lazy=True`` this is a TarDataset: call
+        `ds.close()` when done to cleanup temp files. With ``lazy=False``
+        it is a plain in-memory Dataset.
         
     Examples
     --------
     >>> ds = fx.open_tar('pf20130101.tar.gz', temp_dir='/tmp/mydata')
     >>> ds['SURFTEMPERATURE'].isel(time=0).plot()
     >>> ds.close()  # Cleanup temp files
+    
+    >>> # Small selections: skip extraction entirely
+    >>> ds = fx.open_tar('pf20130101.tar.gz', pattern='*+000*',
+    ...                  variables=['SURFTEMPERATURE'], lazy=False)
     """
-    import tarfile
     import tempfile
     import shutil
     import fnmatch
@@ -564,83 +1298,107 @@ def open_tar(
     if progress:
         print(f"Opening tar archive: {tarpath}")
     
-    # temp_dir is required
-    if temp_dir is None:
+    # temp_dir is required for extraction
+    if lazy and temp_dir is None:
         raise ValueError(
             "temp_dir is required. Specify a directory for extracting tar contents, "
-            "e.g., temp_dir='/tmp/mydata' or temp_dir='./temp'"
+            "e.g., temp_dir='/tmp/mydata' or temp_dir='./temp' (or pass lazy=False "
+            "to read the files straight from the archive)"
         )
     
-    extract_dir = temp_dir
-    os.makedirs(extract_dir, exist_ok=True)
+    stack_levels = kwargs.get('stack_levels', True)
+    extract_dir = temp_dir if lazy else None
+    if extract_dir:
+        os.makedirs(extract_dir, exist_ok=True)
     
     try:
-        # Open tar and filter members
-        with tarfile.open(tarpath, 'r:*') as tar:
-            all_members = tar.getmembers()
+        # Single pass over the archive: members are matched as the table of
+        # contents is read and handed on right away (extracted to disk, or
+        # read into memory), so a compressed archive is decompressed once.
+        # With parallel=True, workers open earlier files meanwhile.
+        if progress:
+            if lazy:
+                print(f"  Extracting matching files to {extract_dir}...")
+            else:
+                print(f"  Reading matching FA files from the archive...")
+        if lazy:
+            # Headers only; the dataset is built once all files are in
+            read = _read_header
+        else:
+            read = functools.partial(_read_single_file, variables=variables,
+                                     stack_levels=stack_levels)
+        names = []
+        paths = []
+        
+        def matching_files(tar):
             # Filter by pattern (only files, not directories)
-            members = [m for m in all_members 
-                      if m.isfile() and fnmatch.fnmatch(m.name, pattern)]
-            
-            if not members:
-                raise FileNotFoundError(
-                    f"No files matching pattern '{pattern}' in {tarpath}"
-                )
-            
-            if progress:
-                print(f"  Extracting {len(members)} files to {extract_dir}...")
-            
-            # Extract matching files
-            tar.extractall(extract_dir, members=members)
+            match = lambda name: fnmatch.fnmatch(name, pattern)
+            for member in _iter_tar_files(tar, tarpath, match):
+                names.append(member.name)
+                if lazy:
+                    tar.extract(member, extract_dir)
+                    paths.append(os.path.join(extract_dir, member.name))
+                    yield paths[-1]
+                else:
+                    # Raw bytes can be sent to a worker process, unlike
+                    # the archive's file object
+                    yield tar.extractfile(member).read()
         
-        # Get list of extracted files
-        extracted_files = sorted([
-            os.path.join(extract_dir, m.name) for m in members
-        ])
+        found = []
+        with _open_tar_archive(tarpath, parallel_extract) as tar:
+            results = _map_files(read, matching_files(tar), parallel, max_workers)
+            for i, result in enumerate(results):
+                found.append((names[i], paths[i] if lazy else None, result))
+                if progress and (i + 1) % 5 == 0:
+                    print(f"  Loaded {i + 1} files...")
         
-        if progress:
-            print(f"  Reading {len(extracted_files)} FA files...")
+        if not found:
+            raise FileNotFoundError(
+                f"No files matching pattern '{pattern}' in {tarpath}"
+            )
         
-        # Read files sequentially with lazy loading
-        datasets = []
-        for i, filepath in enumerate(extracted_files):
-            ds = _read_single_file(filepath, variables=variables,
-                                   stack_levels=kwargs.get('stack_levels', True),
-                                   lazy=True)  # Always lazy
-            datasets.append(ds)
-            if progress and (i + 1) % 5 == 0:
-                print(f"  Loaded {i + 1}/{len(extracted_files)} files...")
+        # Order by forecast hour, then member name
+        found.sort(key=lambda item: (_extract_hour(item[0]), item[0]))
         
-        if progress:
-            print(f"  Concatenating along '{concat_dim}' dimension...")
+        if lazy:
+            # One dask array per variable across all files, straight from
+            # the headers (missing fields are reported and read as NaN)
+            combined = _open_lazy_series([path for _, path, _ in found],
+                                         [header for _, _, header in found],
+                                         variables, stack_levels, concat_dim)
+            del found
+        else:
+            datasets = [ds for _, _, ds in found]
+            del found
+            
+            if progress:
+                print(f"  Concatenating along '{concat_dim}' dimension...")
+            
+            # Verify consistency of variables across files
+            # The user wants to be notified if variables are missing
+            _warn_inconsistent([set(ds.data_vars) for ds in datasets])
+            
+            # Concatenate along the specified dimension
+            # join='exact' ensures we are notified if coordinates (like levels) mismatch
+            # This prevents silent creation of NaN-filled sparse arrays due to precision issues
+            try:
+                combined = _combine_timesteps(datasets, concat_dim, join)
+            except ValueError as e:
+                print("ERROR: Coordinate mismatch during concatenation!")
+                print("Use join='outer' or 'override' if this is due to floating-point precision noise.")
+                raise e
         
-        # Verify consistency of variables across files
-        # The user wants to be notified if variables are missing
-        first_vars = set(datasets[0].data_vars)
-        for i, ds in enumerate(datasets[1:]):
-            current_vars = set(ds.data_vars)
-            if current_vars != first_vars:
-                missing = first_vars - current_vars
-                extra = current_vars - first_vars
-                msg = f"Inconsistent variables in file {i+2}."
-                if missing: msg += f" Missing: {missing}."
-                if extra: msg += f" Extra: {extra}."
-                print(f"WARNING: {msg}")
-                # We could raise an error here if strictness is required
-                
-        # Concatenate along the specified dimension
-        # join='exact' ensures we are notified if coordinates (like levels) mismatch
-        # This prevents silent creation of NaN-filled sparse arrays due to precision issues
-        try:
-            combined = xr.concat(datasets, dim=concat_dim, join='exact')
-        except ValueError as e:
-            print("ERROR: Coordinate mismatch during concatenation!")
-            print("Use join='outer' or 'override' if this is due to floating-point precision noise.")
-            raise e
+        _add_cf_attrs(combined, str(tarpath))
         
         if progress:
             print(f"  Combined shape: {dict(combined.sizes)}")
         
+        if not lazy:
+            # Everything is in memory already, nothing to clean up
+            if progress:
+                print(f"  Done!")
+            return combined
+        
         # Always use lazy loading with chunking
         combined = combined.chunk({'time': 1})
         
@@ -652,6 +1410,6 @@ def open_tar(
             
     except Exception:
         # Cleanup on error
-        if 'extract_dir' in locals() and extract_dir and os.path.exists(extract_dir):
+        if extract_dir and os.path.exists(extract_dir):
             shutil.rmtree(extract_dir, ignore_errors=True)
         raise
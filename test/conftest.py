@@ -0,0 +1,142 @@
+"""
+Shared fixtures: synthetic FA files read through a stand-in for EPyGrAM.
+
+The tests need no real FA data. ``fake_epygram`` replaces the ``epygram``
+module with a minimal reader of the ``.npz`` files written by
+``make_fa_file``, so the whole faxarray stack (FAReader, FADataset and the
+xarray backend) runs on small synthetic grids.
+"""
+
+import os
+import sys
+import types
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+SHAPE = (4, 5)  # (y, x)
+BASE_TIME = datetime(2024, 1, 1)
+
+
+class _Angle:
+    """Like epygram.util.Angle: value available via get('degrees')."""
+
+    def __init__(self, degrees):
+        self._degrees = degrees
+
+    def get(self, unit='degrees'):
+        return self._degrees
+
+
+class _Geometry:
+    # A new instance per field, as EPyGrAM does: the default repr differs
+    # between instances even though they describe the same grid
+    name = 'lambert'
+
+    def __init__(self, shape):
+        self.dimensions = {'X': shape[-1], 'Y': shape[0]}
+        self.grid = {'X_resolution': 2500.0, 'Y_resolution': 2500.0}
+        self.projection = {'reference_lon': _Angle(2.0),
+                           'reference_lat': _Angle(46.0)}
+        self._shape = shape
+
+    def get_lonlat_grid(self):
+        ny, nx = self._shape
+        lons, lats = np.meshgrid(np.linspace(-5.0, 10.0, nx),
+                                 np.linspace(40.0, 50.0, ny))
+        return lons, lats
+
+
+class _Validity:
+    def __init__(self, hour):
+        self._hour = hour
+
+    def get(self):
+        return BASE_TIME + timedelta(hours=self._hour)
+
+    def getbasis(self):
+        return BASE_TIME
+
+    def term(self):
+        return timedelta(hours=self._hour)
+
+
+class _Field:
+    spectral = False
+
+    def __init__(self, data, hour):
+        self._data = data
+        self.geometry = _Geometry(data.shape)
+        self.validity = _Validity(hour)
+
+    def getdata(self):
+        return self._data.copy()
+
+
+class _Resource:
+    def __init__(self, path, mode='r'):
+        with np.load(path) as npz:
+            self._data = {name: npz[name] for name in npz.files}
+        self._hour = int(self._data.pop('__hour__'))
+
+    def listfields(self):
+        return list(self._data)
+
+    def readfield(self, name):
+        return _Field(self._data[name], self._hour)
+
+    def fieldencoding(self, name):
+        return {'spectral': False}
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_epygram(monkeypatch):
+    """Serve files written by make_fa_file through FAReader."""
+    from faxarray import reader
+
+    module = types.ModuleType('epygram')
+    module.init_env = lambda: None
+    module.formats = types.SimpleNamespace(resource=_Resource)
+    monkeypatch.setitem(sys.modules, 'epygram', module)
+    monkeypatch.setattr(reader, '_GEOMETRY_CACHE', {})
+    return module
+
+
+def make_fa_file(directory, hour, fields, prefix='pfTEST'):
+    """
+    Write a synthetic FA file ``<prefix>+HHHH`` with the given 2D fields.
+
+    Returns the path as a str.
+    """
+    path = os.path.join(str(directory), f'{prefix}+{hour:04d}')
+    with open(path, 'wb') as f:
+        np.savez(f, __hour__=np.array(hour), **fields)
+    return path
+
+
+def series_fields(hour):
+    """
+    Fields of one file of the standard test series.
+
+    SURFTEMPERATURE is ``hour`` everywhere, SURFPREC.EAU.CON accumulates
+    ``hour`` per hour (so its hourly value is ``hour``), and two model
+    levels of TEMPERATURE are stacked into one variable. SPECTRAL has
+    another shape and is not part of the dataset.
+    """
+    return {
+        'SURFTEMPERATURE': np.full(SHAPE, float(hour)),
+        'SURFPREC.EAU.CON': np.full(SHAPE, hour * (hour + 1) / 2.0),
+        'S001TEMPERATURE': np.full(SHAPE, 200.0 + hour),
+        'S002TEMPERATURE': np.full(SHAPE, 250.0 + hour),
+        'SPECTRAL': np.zeros(7),
+    }
+
+
+@pytest.fixture
+def fa_series(tmp_path, fake_epygram):
+    """Four hourly files (+0000 .. +0003) of the standard test series."""
+    return [make_fa_file(tmp_path, hour, series_fields(hour)) for hour in range(4)]
@@ -0,0 +1,70 @@
+"""Tests for FA file detection and the xarray backend entry point."""
+
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from faxarray.xarray_backend import FABackendEntrypoint, is_fa_file
+
+from conftest import make_fa_file, series_fields
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    tomllib = pytest.importorskip('tomli')
+
+PYPROJECT = Path(__file__).resolve().parents[1] / 'pyproject.toml'
+
+
+def test_is_fa_file_accepts_path_objects(tmp_path):
+    assert is_fa_file(Path('pfABOFABOF+0001'))
+    assert is_fa_file(Path('data') / 'surface.sfx')
+    assert is_fa_file('pfABOFABOF+0001')
+    assert not is_fa_file(tmp_path / 'missing.nc')
+
+
+def test_guess_can_open_trusts_fa_names():
+    backend = FABackendEntrypoint()
+    assert backend.guess_can_open('pfABOFABOF+0001')
+    assert backend.guess_can_open(Path('data') / 'surface.sfx')
+    assert not backend.guess_can_open('data.nc')
+
+
+def test_guess_can_open_requires_file_without_trust(tmp_path):
+    backend = FABackendEntrypoint()
+    backend.trust_extension = False
+    assert not backend.guess_can_open(str(tmp_path / 'pfABOFABOF+0001'))
+    path = make_fa_file(tmp_path, 1, series_fields(1), prefix='pfABOFABOF')
+    assert backend.guess_can_open(path)
+    assert not backend.guess_can_open(str(tmp_path))
+
+
+@pytest.mark.parametrize('obj', [
+    io.BytesIO(b'data'),
+    b'pfABOFABOF+0001',
+    'https://example.org/pfABOFABOF+0001',
+    None,
+])
+def test_guess_can_open_rejects_non_paths(obj):
+    assert not FABackendEntrypoint().guess_can_open(obj)
+
+
+def test_entry_points_are_registered():
+    with open(PYPROJECT, 'rb') as f:
+        entry_points = tomllib.load(f)['project']['entry-points']['xarray.backends']
+    target = f'{FABackendEntrypoint.__module__}:{FABackendEntrypoint.__name__}'
+    assert entry_points == {'faxarray': target, 'fa': target}
+
+
+def test_open_dataset_through_backend(tmp_path, fake_epygram):
+    path = make_fa_file(tmp_path, 2, series_fields(2))
+    ds = xr.open_dataset(path, engine=FABackendEntrypoint,
+                         drop_variables=['SURFPREC_EAU_CON'])
+    assert set(ds.data_vars) == {'SURFTEMPERATURE', 'TEMPERATURE'}
+    assert ds['TEMPERATURE'].dims == ('time', 'level', 'y', 'x')
+    np.testing.assert_array_equal(ds['SURFTEMPERATURE'].values, 2.0)
+    assert ds.attrs['source'] == path
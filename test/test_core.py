@@ -0,0 +1,31 @@
+"""
+Tests for FADataset, on synthetic files (see conftest.py).
+"""
+
+import numpy as np
+
+from faxarray import open_fa
+
+from conftest import make_fa_file, series_fields
+
+
+def test_stacked_levels_upcast_like_np_stack(tmp_path, fake_epygram):
+    fields = series_fields(0)
+    fields['S001TEMPERATURE'] = fields['S001TEMPERATURE'].astype(np.float32)
+    fields['S002TEMPERATURE'] = fields['S002TEMPERATURE'] + 1e-9
+    fa = open_fa(make_fa_file(tmp_path, 0, fields))
+    temperature = fa.to_xarray()['TEMPERATURE']
+    expected = np.stack([fields['S001TEMPERATURE'], fields['S002TEMPERATURE']])
+    assert temperature.dtype == expected.dtype == np.float64
+    np.testing.assert_array_equal(temperature.values[0], expected)
+
+
+def test_stacked_levels_do_not_alias_the_file_cache(tmp_path, fake_epygram):
+    fa = open_fa(make_fa_file(tmp_path, 0, series_fields(0)))
+    ds = fa.to_xarray()
+    ds['TEMPERATURE'].values[...] = -1.0
+    np.testing.assert_array_equal(fa['S001TEMPERATURE'].data, 200.0)
+    # Converting again still finds every field
+    again = fa.to_xarray()
+    assert set(again.data_vars) == set(ds.data_vars)
+    np.testing.assert_array_equal(again['TEMPERATURE'].values[0, :, 0, 0], [200.0, 250.0])
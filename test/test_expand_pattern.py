@@ -0,0 +1,64 @@
+"""
+Tests for glob patterns given to open_mfdataset (see _expand_pattern).
+"""
+
+import os
+from glob import glob
+
+import numpy as np
+import pytest
+
+from faxarray.xarray_backend import _expand_pattern, open_mfdataset
+
+from conftest import make_fa_file, series_fields
+
+
+def touch(path):
+    with open(path, 'w'):
+        pass
+    return str(path)
+
+
+def test_glob_string_is_sorted_by_forecast_hour(tmp_path, fake_epygram):
+    # Written out of order; +0010 would sort before +0002 by name alone
+    for hour in (10, 2, 0, 1):
+        make_fa_file(tmp_path, hour, series_fields(hour))
+    ds = open_mfdataset(str(tmp_path / 'pfTEST+*'), lazy=False)
+    np.testing.assert_array_equal(ds['SURFTEMPERATURE'].values[:, 0, 0], [0, 1, 2, 10])
+
+
+def test_hidden_files_only_match_dot_patterns(tmp_path):
+    visible = touch(tmp_path / 'pfTEST+0001')
+    hidden = touch(tmp_path / '.pfTEST+0002')
+    assert _expand_pattern(str(tmp_path / '*')) == [visible]
+    assert _expand_pattern(str(tmp_path / '.*')) == [hidden]
+    for pattern in ('*', '.*', '*TEST*'):
+        assert sorted(_expand_pattern(str(tmp_path / pattern))) == \
+            sorted(glob(str(tmp_path / pattern)))
+
+
+def test_matching_directories_are_skipped(tmp_path):
+    path = touch(tmp_path / 'pfTEST+0001')
+    os.mkdir(tmp_path / 'pfTEST+0002')
+    assert _expand_pattern(str(tmp_path / 'pfTEST+*')) == [path]
+
+
+def test_pattern_without_wildcards_is_a_path(tmp_path):
+    path = touch(tmp_path / 'pfTEST+0001')
+    assert _expand_pattern(path) == [path]
+    assert _expand_pattern(str(tmp_path / 'pfTEST+0002')) == []
+
+
+def test_wildcards_in_directory_go_through_glob(tmp_path):
+    (tmp_path / 'run1').mkdir()
+    path = touch(tmp_path / 'run1' / 'pfTEST+0001')
+    assert _expand_pattern(str(tmp_path / 'run*' / 'pfTEST+*')) == [path]
+
+
+def test_pattern_matching_nothing_raises(tmp_path):
+    touch(tmp_path / 'pfTEST+0001')
+    pattern = str(tmp_path / 'pfOTHER+*')
+    with pytest.raises(FileNotFoundError, match='No files found matching pattern'):
+        open_mfdataset(pattern, lazy=False)
+    with pytest.raises(FileNotFoundError):
+        open_mfdataset(str(tmp_path / 'missing' / 'pf*'), lazy=False)
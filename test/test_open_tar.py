@@ -0,0 +1,177 @@
+"""
+Tests for open_tar, on archives of the synthetic series (see conftest.py).
+"""
+
+import os
+import tarfile
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from faxarray import xarray_backend
+from faxarray.xarray_backend import TarDataset, open_mfdataset, open_tar
+
+from conftest import make_fa_file, series_fields
+
+
+def make_archive(tmp_path, paths, name='series.tar'):
+    """Archive the given files under their base names."""
+    tarpath = str(tmp_path / name)
+    mode = 'w:gz' if name.endswith(('.tar.gz', '.tgz')) else 'w'
+    with tarfile.open(tarpath, mode) as tar:
+        # Reverse order: open_tar orders members by forecast hour
+        for path in reversed(paths):
+            tar.add(path, arcname=os.path.basename(path))
+    return tarpath
+
+
+@pytest.fixture
+def tar_index(monkeypatch):
+    """An empty archive index cache, restored after the test."""
+    index = {}
+    monkeypatch.setattr(xarray_backend, '_TAR_INDEX_CACHE', index)
+    return index
+
+
+def surface_hours(ds):
+    return list(ds['SURFTEMPERATURE'].values[:, 0, 0])
+
+
+@pytest.mark.parametrize('name', ['series.tar', 'series.tar.gz'])
+@pytest.mark.parametrize('parallel_extract', [True, False])
+def test_eager_matches_open_mfdataset(fa_series, tmp_path, name, parallel_extract):
+    tarpath = make_archive(tmp_path, fa_series, name)
+    ds = open_tar(tarpath, lazy=False, parallel_extract=parallel_extract)
+    assert not isinstance(ds, TarDataset)
+    xr.testing.assert_equal(ds, open_mfdataset(fa_series, lazy=False))
+
+
+def test_lazy_extracts_and_cleans_up(fa_series, tmp_path):
+    pytest.importorskip('dask')
+    tarpath = make_archive(tmp_path, fa_series)
+    temp_dir = str(tmp_path / 'extracted')
+    ds = open_tar(tarpath, temp_dir=temp_dir)
+    assert isinstance(ds, TarDataset)
+    assert ds['SURFTEMPERATURE'].chunks is not None
+    # assert_equal also compares Dataset types: check variable by variable
+    eager = open_mfdataset(fa_series, lazy=False)
+    assert set(ds.variables) == set(eager.variables)
+    for name in eager.variables:
+        xr.testing.assert_equal(ds[name].compute(), eager[name])
+    ds.close()
+    assert not os.path.exists(temp_dir)
+
+
+def test_closed_lazy_dataset_raises_on_compute(fa_series, tmp_path):
+    pytest.importorskip('dask')
+    ds = open_tar(make_archive(tmp_path, fa_series), temp_dir=str(tmp_path / 'extracted'))
+    ds.close()
+    with pytest.raises(OSError):
+        ds['SURFTEMPERATURE'].compute()
+
+
+def test_lazy_requires_temp_dir(fa_series, tmp_path):
+    with pytest.raises(ValueError, match='temp_dir'):
+        open_tar(make_archive(tmp_path, fa_series))
+
+
+def test_pattern_selects_members(fa_series, tmp_path):
+    tarpath = make_archive(tmp_path, fa_series)
+    ds = open_tar(tarpath, pattern='*+000[12]', lazy=False)
+    np.testing.assert_array_equal(ds['SURFTEMPERATURE'].values[:, 0, 0], [1, 2])
+    with pytest.raises(FileNotFoundError):
+        open_tar(tarpath, pattern='*+0009', lazy=False)
+
+
+def test_join_on_level_mismatch(fa_series, tmp_path):
+    # A later file with a third model level of TEMPERATURE
+    fields = series_fields(4)
+    fields['S003TEMPERATURE'] = fields['S002TEMPERATURE'] + 50.0
+    extra_dir = tmp_path / 'extra'
+    extra_dir.mkdir()
+    tarpath = make_archive(tmp_path, fa_series + [make_fa_file(extra_dir, 4, fields)])
+    with pytest.raises(ValueError):
+        open_tar(tarpath, lazy=False)
+    ds = open_tar(tarpath, lazy=False, join='outer')
+    assert ds.sizes['level'] == 3
+    assert np.isnan(ds['TEMPERATURE'].values[0, 2]).all()
+    assert ds['TEMPERATURE'].values[-1, 2, 0, 0] == 304.0
+
+
+@pytest.mark.parametrize('name', ['series.tar', 'series.tar.gz'])
+def test_reopening_uses_the_archive_index(fa_series, tmp_path, tar_index, name):
+    tarpath = make_archive(tmp_path, fa_series, name)
+    assert surface_hours(open_tar(tarpath, lazy=False)) == [0, 1, 2, 3]
+    (key, members), = tar_index.items()
+    assert sorted(member.name for member in members) == \
+        sorted(os.path.basename(path) for path in fa_series)
+    assert surface_hours(open_tar(tarpath, pattern='*+000[23]', lazy=False)) == [2, 3]
+    # Later opens only look at the indexed members
+    tar_index[key] = [m for m in members if m.name.endswith(('+0000', '+0001'))]
+    assert surface_hours(open_tar(tarpath, lazy=False)) == [0, 1]
+
+
+def test_rewritten_archive_is_read_again(fa_series, tmp_path, tar_index):
+    tarpath = make_archive(tmp_path, fa_series[:2])
+    assert surface_hours(open_tar(tarpath, lazy=False)) == [0, 1]
+    make_archive(tmp_path, fa_series)
+    assert surface_hours(open_tar(tarpath, lazy=False)) == [0, 1, 2, 3]
+
+
+def test_archive_index_keeps_the_latest_archives(fa_series, tmp_path, tar_index):
+    size = xarray_backend._TAR_INDEX_CACHE_SIZE
+    tarpaths = [make_archive(tmp_path, fa_series[:1], f'series{k}.tar')
+                for k in range(size + 1)]
+    for tarpath in tarpaths:
+        open_tar(tarpath, lazy=False)
+    assert len(tar_index) == size
+    assert {key[0] for key in tar_index} == \
+        {os.path.abspath(path) for path in tarpaths[1:]}
+
+
+@pytest.fixture
+def pigz_shim(monkeypatch):
+    """Stand gzip in for pigz (same -dc interface); returns the started processes."""
+    import shutil
+    import subprocess
+
+    gzip = shutil.which('gzip')
+    if gzip is None:
+        pytest.skip('gzip is not installed')
+    which = shutil.which
+    monkeypatch.setattr(shutil, 'which', lambda cmd: gzip if cmd == 'pigz' else which(cmd))
+
+    started = []
+
+    class Popen(subprocess.Popen):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            started.append(self)
+
+    monkeypatch.setattr(subprocess, 'Popen', Popen)
+    return started
+
+
+def test_gzipped_archive_through_pigz(fa_series, tmp_path, tar_index, pigz_shim):
+    tarpath = make_archive(tmp_path, fa_series, 'series.tar.gz')
+    ds = open_tar(tarpath, lazy=False)
+    assert len(pigz_shim) == 1 and pigz_shim[0].returncode == 0
+    xr.testing.assert_equal(ds, open_mfdataset(fa_series, lazy=False))
+    open_tar(tarpath, lazy=False, parallel_extract=False)
+    assert len(pigz_shim) == 1
+
+
+def test_pigz_is_killed_when_reading_stops_early(fa_series, tmp_path, pigz_shim):
+    import signal
+
+    # Incompressible padding after the first member: more than a pipe
+    # buffer is left when reading stops, so the decompressor is still busy
+    padding = tmp_path / 'padding'
+    padding.write_bytes(np.random.default_rng(0).bytes(4 << 20))
+    tarpath = make_archive(tmp_path, [str(padding), fa_series[0]], 'series.tar.gz')
+    with xarray_backend._open_tar_archive(tarpath) as tar:
+        assert next(iter(tar)).name == os.path.basename(fa_series[0])
+    proc, = pigz_shim
+    assert proc.returncode == -signal.SIGKILL
+    assert proc.stdout.closed
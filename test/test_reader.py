@@ -0,0 +1,46 @@
+"""
+Tests for the lon/lat grid cache of faxarray.reader.
+"""
+
+import numpy as np
+import pytest
+
+from faxarray import open_fa, reader
+
+from conftest import SHAPE, _Angle, _Geometry, make_fa_file, series_fields
+
+
+class _Opaque:
+    """A grid parameter whose default repr embeds id()."""
+
+
+def test_geometry_key_depends_on_values_not_instances():
+    assert reader._geometry_key(_Geometry(SHAPE), SHAPE) == \
+        reader._geometry_key(_Geometry(SHAPE), SHAPE)
+    moved = _Geometry(SHAPE)
+    moved.projection = dict(moved.projection, reference_lon=_Angle(3.0))
+    assert reader._geometry_key(moved, SHAPE) != \
+        reader._geometry_key(_Geometry(SHAPE), SHAPE)
+
+
+def test_same_grid_decoded_once(fake_epygram):
+    lons, _ = reader._get_lonlat(_Geometry(SHAPE), SHAPE)
+    assert reader._get_lonlat(_Geometry(SHAPE), SHAPE)[0] is lons
+    assert len(reader._GEOMETRY_CACHE) == 1
+    assert not lons.flags.writeable
+
+
+def test_unkeyable_geometry_is_not_cached(fake_epygram):
+    geometry = _Geometry(SHAPE)
+    geometry.grid = {'X_resolution': _Opaque()}
+    lons, _ = reader._get_lonlat(geometry, SHAPE)
+    assert reader._GEOMETRY_CACHE == {}
+    np.testing.assert_array_equal(lons, _Geometry(SHAPE).get_lonlat_grid()[0])
+
+
+def test_datasets_share_read_only_coordinates(tmp_path, fake_epygram):
+    first, second = (open_fa(make_fa_file(tmp_path, hour, series_fields(hour))).to_xarray()
+                     for hour in range(2))
+    assert np.shares_memory(first['lat'].values, second['lat'].values)
+    with pytest.raises(ValueError):
+        first['lat'].values[0, 0] = -90.0
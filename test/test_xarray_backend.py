@@ -0,0 +1,172 @@
+"""
+Tests for the multi-file openers of faxarray.xarray_backend.
+
+All files are synthetic (see conftest.py): four hourly files in which
+SURFTEMPERATURE equals the forecast hour and SURFPREC.EAU.CON accumulates
+the hour, so the expected series are known in closed form.
+"""
+
+import os
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from faxarray import xarray_backend
+from faxarray.xarray_backend import _combine_timesteps, open_mfdataset
+
+from conftest import make_fa_file, series_fields
+
+DEACCUM = ['SURFPREC.EAU.CON']
+
+
+def check_deaccumulated(ds):
+    """Expected content of the standard series de-accumulated from +0000."""
+    assert ds.sizes['time'] == 3
+    assert ds['SURFTEMPERATURE'].dims == ('time', 'y', 'x')
+    assert ds['TEMPERATURE'].dims == ('time', 'level', 'y', 'x')
+    assert ds['SURFPREC_EAU_CON'].dims == ('time', 'y', 'x')
+    np.testing.assert_array_equal(ds['SURFTEMPERATURE'].values[:, 0, 0], [1, 2, 3])
+    np.testing.assert_array_equal(ds['TEMPERATURE'].values[:, :, 0, 0],
+                                  [[201, 251], [202, 252], [203, 253]])
+    np.testing.assert_array_equal(ds['SURFPREC_EAU_CON'].values[:, 0, 0], [1, 2, 3])
+    np.testing.assert_array_equal(ds['time'].values, np.array(
+        ['2024-01-01T01', '2024-01-01T02', '2024-01-01T03'], dtype='datetime64[ns]'))
+
+
+def test_streamed_deaccumulation(fa_series, tmp_path):
+    pytest.importorskip('netCDF4')
+    output_file = str(tmp_path / 'out.nc')
+    with open_mfdataset(fa_series, deaccumulate=DEACCUM, output_file=output_file,
+                        lazy=False) as ds:
+        check_deaccumulated(ds)
+
+
+def test_in_memory_deaccumulation(fa_series):
+    ds = open_mfdataset(fa_series, deaccumulate=DEACCUM, lazy=False)
+    check_deaccumulated(ds)
+
+
+def test_in_memory_matches_streamed(fa_series, tmp_path):
+    pytest.importorskip('netCDF4')
+    in_memory = open_mfdataset(fa_series, deaccumulate=DEACCUM, lazy=False)
+    output_file = str(tmp_path / 'out.nc')
+    with open_mfdataset(fa_series, deaccumulate=DEACCUM, output_file=output_file,
+                        lazy=False) as streamed:
+        for name in in_memory.data_vars:
+            np.testing.assert_array_equal(streamed[name].values, in_memory[name].values)
+
+
+def test_page_cache_is_only_dropped_on_request(fa_series, monkeypatch):
+    released = []
+    monkeypatch.setattr(xarray_backend, '_release_file_cache', released.append)
+    open_mfdataset(fa_series, deaccumulate=DEACCUM, lazy=False)
+    assert released == []
+    open_mfdataset(fa_series, deaccumulate=DEACCUM, lazy=False, drop_page_cache=True)
+    assert released == fa_series
+
+
+def test_concatenation_without_deaccumulation(fa_series):
+    ds = open_mfdataset(fa_series, lazy=False)
+    assert ds.sizes['time'] == 4
+    assert ds['SURFTEMPERATURE'].dims == ('time', 'y', 'x')
+    np.testing.assert_array_equal(ds['SURFTEMPERATURE'].values[:, 0, 0], [0, 1, 2, 3])
+    # Cumulative values are passed through untouched
+    np.testing.assert_array_equal(ds['SURFPREC_EAU_CON'].values[:, 0, 0], [0, 1, 3, 6])
+    assert 'SPECTRAL' not in ds
+
+
+def test_single_timestep_has_time_dimension(fa_series):
+    ds = open_mfdataset(fa_series[:1], lazy=False)
+    assert ds.sizes['time'] == 1
+    assert all('time' in var.dims for var in ds.data_vars.values())
+
+
+def test_combine_timesteps_stacks_fields_lacking_the_dimension():
+    # time is a length-1 dimension of each dataset, but not of its field
+    datasets = [
+        xr.Dataset({'T': (('y', 'x'), np.full((2, 2), float(hour)))},
+                   coords={'time': np.array([hour], dtype='datetime64[h]')})
+        for hour in range(3)
+    ]
+    ds = _combine_timesteps(datasets, 'time')
+    assert ds['T'].dims == ('time', 'y', 'x')
+    np.testing.assert_array_equal(ds['T'].values[:, 0, 0], [0, 1, 2])
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    {'deaccumulate': DEACCUM},
+    {'stack_levels': False},
+    {'drop_variables': ['TEMPERATURE']},
+    {'variables': ['SURFTEMPERATURE', 'SURFPREC.EAU.CON']},
+])
+def test_lazy_matches_eager(fa_series, options):
+    pytest.importorskip('dask')
+    eager = open_mfdataset(fa_series, lazy=False, **options)
+    lazy = open_mfdataset(fa_series, lazy=True, **options)
+    assert all(var.chunks is not None for var in lazy.data_vars.values())
+    xr.testing.assert_identical(lazy.compute(), eager)
+    assert lazy['time'].encoding['units'] == 'hours since 1970-01-01'
+    for name, var in eager.data_vars.items():
+        assert lazy[name].encoding.get('dtype') == var.encoding.get('dtype')
+
+
+def test_lazy_rejects_unsupported_arguments(fa_series):
+    pytest.importorskip('dask')
+    with pytest.raises(TypeError):
+        open_mfdataset(fa_series, lazy=True, levels=[1])
+
+
+def test_lazy_raises_for_deleted_file(fa_series):
+    pytest.importorskip('dask')
+    ds = open_mfdataset(fa_series, lazy=True)
+    os.remove(fa_series[1])
+    with pytest.raises(OSError):
+        ds['SURFTEMPERATURE'].compute()
+
+
+def test_lazy_reads_off_grid_field_as_nan(fa_series, tmp_path):
+    pytest.importorskip('dask')
+    # A later file where SURFTEMPERATURE is off-grid: the eager readers
+    # skip it, the lazy series reads it as missing
+    fields = series_fields(4)
+    fields['SURFTEMPERATURE'] = np.zeros(3)
+    paths = fa_series + [make_fa_file(tmp_path, 4, fields)]
+    ds = open_mfdataset(paths, lazy=True).compute()
+    assert np.isnan(ds['SURFTEMPERATURE'].values[-1]).all()
+    np.testing.assert_array_equal(ds['SURFTEMPERATURE'].values[:-1, 0, 0], [0, 1, 2, 3])
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_int16_packing_round_trip(tmp_path, fake_epygram, lazy):
+    netCDF4 = pytest.importorskip('netCDF4')
+    if lazy:
+        pytest.importorskip('dask')
+    # Hourly values that are not multiples of the 0.01 scale factor
+    hourly = [0.0, 1.2345, 0.5, 3.14159]
+    paths = []
+    for hour in range(4):
+        fields = series_fields(hour)
+        fields['SURFPREC.EAU.CON'] = np.full(fields['SURFTEMPERATURE'].shape,
+                                             sum(hourly[:hour + 1]))
+        paths.append(make_fa_file(tmp_path, hour, fields))
+    output_file = str(tmp_path / 'out.nc')
+    ds = open_mfdataset(paths, deaccumulate=DEACCUM, output_file=output_file,
+                        dtype='int16', lazy=lazy)
+    ds.close()
+    with netCDF4.Dataset(output_file) as nc:
+        var = nc.variables['SURFPREC_EAU_CON']
+        assert var.dtype == np.int16
+        assert var.scale_factor == pytest.approx(0.01)
+    with xr.open_dataset(output_file) as ds:
+        np.testing.assert_allclose(ds['SURFPREC_EAU_CON'].values[:, 0, 0], hourly[1:],
+                                   atol=0.005 + 1e-9)
+        # Other fields are stored unpacked
+        np.testing.assert_array_equal(ds['SURFTEMPERATURE'].values[:, 0, 0], [1, 2, 3])
+
+
+def test_chunk_hours_is_deprecated(fa_series):
+    with pytest.warns(FutureWarning, match='chunk_hours'):
+        ds = open_mfdataset(fa_series, chunk_hours=2, lazy=False)
+    xr.testing.assert_identical(ds, open_mfdataset(fa_series, lazy=False))
@@ -11,8 +11,15 @@ This script:
 import sys
 import os
 import time
+import json
+import hashlib
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import xarray as xr
+import matplotlib
+matplotlib.use('Agg')  # the plot is only saved: no GUI backend needed
 import matplotlib.pyplot as plt
 
 # Add parent dir to path for faxarray
@@ -21,6 +28,14 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import epygram
 import faxarray as fx
 
+# h5netcdf skips the libnetcdf layer and writes faster; fall back to
+# xarray's default engine when it is not installed
+try:
+    import h5netcdf  # noqa: F401
+    NC_ENGINE = 'h5netcdf'
+except ImportError:
+    NC_ENGINE = None
+
 # Configuration
 FA_FILE = '/home/dev/PROJECTS/proj-dat/pfABOFABOF+0001'
 OUTPUT_DIR = '/home/dev/PROJECTS/Epygram-xarray/test'
@@ -33,30 +48,129 @@ FIELDS_TO_TEST = [
     'SURFGEOPOTEN',
 ]
 
-def convert_with_epygram(fa_file, fields, output_dir):
-    """Convert using EPyGrAM directly."""
+# Maps are drawn on at most this many cells per axis (plenty at 150 dpi);
+# histograms use every HIST_STRIDE-th difference value
+PLOT_MAX_CELLS = 500
+HIST_STRIDE = 10
+
+
+def netcdf_encoding(ds):
+    """
+    NetCDF encoding: uncompressed, one chunk per 2D field (slab).
+    
+    Fields keep their precision (the comparison checks differences down to
+    1e-10); the 2D lon/lat grids, only used for plotting, are stored as
+    float32.
+    """
+    encoding = {
+        name: {
+            'zlib': False,
+            'chunksizes': (1,) * (var.ndim - 2) + var.shape[-2:],
+        }
+        for name, var in ds.data_vars.items()
+    }
+    for name, var in ds.coords.items():
+        if var.ndim == 2 and var.dtype.kind == 'f':
+            encoding[name] = {'zlib': False, 'chunksizes': var.shape,
+                              'dtype': 'float32'}
+    return encoding
+
+
+def open_output(output_file):
+    """
+    Open a written output without caching: each variable is read from disk
+    when accessed and not kept on the dataset afterwards.
+    """
+    return xr.open_dataset(output_file, engine=NC_ENGINE, cache=False)
+
+
+def fields_hash(fields):
+    """Stable digest of the requested field list."""
+    return hashlib.sha1(json.dumps(list(fields)).encode()).hexdigest()
+
+
+def is_cache_valid(output_file, fa_file, fields):
+    """
+    True if ``output_file`` is newer than ``fa_file`` and its sidecar
+    ``.json`` records the same source file and field list.
+    """
+    meta_file = output_file + '.json'
+    if not (os.path.exists(output_file) and os.path.exists(meta_file)):
+        return False
+    if os.path.getmtime(output_file) <= os.path.getmtime(fa_file):
+        return False
+    try:
+        with open(meta_file) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return (meta.get('fa_file') == os.path.abspath(fa_file)
+            and meta.get('fields_hash') == fields_hash(fields))
+
+
+def write_cache_meta(output_file, fa_file, fields):
+    """Write the sidecar ``.json`` checked by is_cache_valid."""
+    with open(output_file + '.json', 'w') as f:
+        json.dump({'fa_file': os.path.abspath(fa_file),
+                   'fields_hash': fields_hash(fields)}, f)
+
+
+def read_epygram_field(fa_file, fname, with_lonlat=False):
+    """
+    Read one field as gridpoint data through its own EPyGrAM resource.
+    
+    Runs in a worker process: EPyGrAM is not thread-safe, so fields are
+    read in parallel by processes, each opening the file itself. With
+    ``with_lonlat`` the (lons, lats) grid is returned along with the data.
+    """
+    r = epygram.formats.resource(fa_file, 'r')
+    try:
+        f = r.readfield(fname)
+        if hasattr(f, 'spectral') and f.spectral:
+            f.sp2gp()
+        if with_lonlat:
+            return f.getdata(), f.geometry.get_lonlat_grid()
+        return f.getdata()
+    finally:
+        r.close()
+
+
+def convert_with_epygram(fa_file, fields, output_dir, force=False):
+    """
+    Convert using EPyGrAM directly.
+    
+    The reference output is reused when it is newer than ``fa_file`` and was
+    written for the same fields, unless ``force`` is set.
+    """
     print("\n" + "="*60)
     print("STEP 1: Converting with EPyGrAM Python API")
     print("="*60)
     
-    epygram.init_env()
+    output_file = os.path.join(output_dir, 'epygram_output.nc')
+    if not force and is_cache_valid(output_file, fa_file, fields):
+        print(f"  Using cached output: {output_file} (--force to rebuild)")
+        return output_file, open_output(output_file)
     
     start = time.time()
-    r = epygram.formats.resource(fa_file, 'r')
     
     data = {}
-    lons = lats = None
     
-    for fname in fields:
-        print(f"  Reading {fname}...")
-        f = r.readfield(fname)
-        if hasattr(f, 'spectral') and f.spectral:
-            f.sp2gp()
-        data[fname] = f.getdata()
-        if lons is None:
-            lons, lats = f.geometry.get_lonlat_grid()
+    n_workers = min(len(fields), os.cpu_count() or 1)
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx,
+                             initializer=epygram.init_env) as ex:
+        # The geometry is shared: only the first field fetches lon/lat
+        first, *rest = fields
+        first_future = ex.submit(read_epygram_field, fa_file, first, True)
+        futures = {fname: ex.submit(read_epygram_field, fa_file, fname)
+                   for fname in rest}
+        
+        print(f"  Reading {first}...")
+        data[first], (lons, lats) = first_future.result()
+        for fname, future in futures.items():
+            print(f"  Reading {fname}...")
+            data[fname] = future.result()
     
-    r.close()
     read_time = time.time() - start
     
     # Create xarray dataset
@@ -65,9 +179,11 @@ def convert_with_epygram(fa_file, fields, output_dir):
         coords={'lat': (['y', 'x'], lats), 'lon': (['y', 'x'], lons)}
     )
     
-    # Save
-    output_file = os.path.join(output_dir, 'epygram_output.nc')
-    ds.to_netcdf(output_file)
+    # Save (drop the old sidecar first so an interrupted write is not reused)
+    if os.path.exists(output_file + '.json'):
+        os.remove(output_file + '.json')
+    ds.to_netcdf(output_file, engine=NC_ENGINE, encoding=netcdf_encoding(ds))
+    write_cache_meta(output_file, fa_file, fields)
     total_time = time.time() - start
     
     print(f"\n  EPyGrAM time: {total_time:.2f}s")
@@ -76,8 +192,13 @@ def convert_with_epygram(fa_file, fields, output_dir):
     return output_file, ds
 
 
-def convert_with_faxarray(fa_file, fields, output_dir):
-    """Convert using faxarray."""
+def convert_with_faxarray(fa_file, fields, output_dir, save=True):
+    """
+    Convert using faxarray.
+    
+    The NetCDF output is only written when ``save`` is set; otherwise the
+    returned path is None and the dataset is compared from memory.
+    """
     print("\n" + "="*60)
     print("STEP 2: Converting with faxarray")
     print("="*60)
@@ -85,52 +206,100 @@ def convert_with_faxarray(fa_file, fields, output_dir):
     start = time.time()
     fa = fx.open_fa(fa_file)
     
-    # Get subset as xarray
-    ds = fa.to_xarray(variables=fields, progress=False)
+    # Get subset as xarray, one 2D variable per field like the EPyGrAM output
+    ds = fa.to_xarray(variables=fields, stack_levels=False, progress=False)
     
     # Save
-    output_file = os.path.join(output_dir, 'faxarray_output.nc')
-    ds.to_netcdf(output_file)
+    output_file = None
+    if save:
+        output_file = os.path.join(output_dir, 'faxarray_output.nc')
+        ds.to_netcdf(output_file, engine=NC_ENGINE, encoding=netcdf_encoding(ds))
     total_time = time.time() - start
     
     print(f"\n  faxarray time: {total_time:.2f}s")
-    print(f"  Output: {output_file}")
+    print(f"  Output: {output_file or 'not saved (--save-nc to write it)'}")
     
     fa.close()
     return output_file, ds
 
 
-def compare_and_plot(ds_epygram, ds_faxarray, fields, output_dir):
-    """Compare the two outputs and plot differences."""
+def diff_stats(diff):
+    """
+    Max absolute difference, mean difference and RMSE, ignoring NaNs.
+    
+    NaNs are dropped once, then each statistic is a single plain
+    reduction over the valid values (sum of squares via a dot product,
+    without a squared temporary).
+    """
+    valid = diff[~np.isnan(diff)]
+    if valid.size == 0:
+        return np.nan, np.nan, np.nan
+    max_abs_diff = max(valid.max(), -valid.min())
+    mean_diff = valid.sum() / valid.size
+    rmse = np.sqrt(np.dot(valid, valid) / valid.size)
+    return max_abs_diff, mean_diff, rmse
+
+
+def field_diff(ds_epygram, ds_faxarray, fname, out=None):
+    """
+    Read one field from both outputs; return (epygram, faxarray, difference).
+    
+    The difference is written into ``out`` when its shape and dtype fit,
+    so one buffer can be reused across fields.
+    """
+    epygram_data = ds_epygram[fname].to_numpy()
+    faxarray_data = ds_faxarray[fname].to_numpy()
+    dtype = np.result_type(faxarray_data, epygram_data)
+    if out is None or out.shape != epygram_data.shape or out.dtype != dtype:
+        out = np.empty(epygram_data.shape, dtype=dtype)
+    np.subtract(faxarray_data, epygram_data, out=out)
+    return epygram_data, faxarray_data, out
+
+
+def compare_and_plot(ds_epygram, ds_faxarray, fields, output_dir, plot=True):
+    """
+    Compare the two outputs and plot the fields that differ.
+    
+    Returns
+    -------
+    tuple
+        (all_close, plot_file); plot_file is None when nothing was plotted
+        (all fields match, or ``plot=False``).
+    """
     print("\n" + "="*60)
     print("STEP 3: Comparing outputs")
     print("="*60)
     
-    # Normalize field names (EPyGrAM replaces . with _)
-    fields_normalized = [f.replace('.', '_') for f in fields]
+    # (field, dataset variable) pairs: both outputs replace . with _
+    pairs = [(f, f.replace('.', '_')) for f in fields]
     
-    # Create comparison plots
-    n_fields = len(fields_normalized)
-    fig, axes = plt.subplots(n_fields, 4, figsize=(16, 4*n_fields))
+    # faxarray adds a length-1 time dimension
+    if 'time' in ds_faxarray.dims:
+        ds_faxarray = ds_faxarray.isel(time=0)
     
-    if n_fields == 1:
-        axes = axes.reshape(1, -1)
+    # Fast path: one pass/fail check over all fields (coordinates aside);
+    # per-field statistics are only needed to diagnose a failure
+    names = [fname for _, fname in pairs]
+    try:
+        xr.testing.assert_allclose(ds_faxarray[names].reset_coords(drop=True),
+                                   ds_epygram[names].reset_coords(drop=True),
+                                   rtol=0, atol=1e-10)
+    except AssertionError:
+        print("\n  Differences found, computing per-field statistics...")
+    else:
+        print(f"\n  ✓ All {len(names)} fields match (diff < 1e-10)")
+        return True, None
     
-    all_close = True
+    mismatched = {}  # variable name -> max absolute difference
+    diff = None
     
-    for i, fname in enumerate(fields_normalized):
+    for _, fname in pairs:
         print(f"\n  Comparing {fname}...")
         
-        epygram_data = ds_epygram[fname].values
-        faxarray_data = ds_faxarray[fname].values
-        
-        # Compute difference
-        diff = faxarray_data - epygram_data
+        _, _, diff = field_diff(ds_epygram, ds_faxarray, fname, out=diff)
         
         # Statistics
-        max_abs_diff = np.nanmax(np.abs(diff))
-        mean_diff = np.nanmean(diff)
-        rmse = np.sqrt(np.nanmean(diff**2))
+        max_abs_diff, mean_diff, rmse = diff_stats(diff)
         
         print(f"    Max absolute difference: {max_abs_diff:.2e}")
         print(f"    Mean difference: {mean_diff:.2e}")
@@ -139,45 +308,82 @@ def compare_and_plot(ds_epygram, ds_faxarray, fields, output_dir):
         # Check if close
         if max_abs_diff > 1e-10:
             print(f"    ⚠️  WARNING: Non-zero difference detected!")
-            all_close = False
+            mismatched[fname] = max_abs_diff
         else:
             print(f"    ✓ Values match (diff < 1e-10)")
+    
+    all_close = not mismatched
+    if not plot or all_close:
+        return all_close, None
+    return all_close, plot_differences(ds_epygram, ds_faxarray, mismatched, output_dir)
+
+
+def plot_differences(ds_epygram, ds_faxarray, max_abs_diffs, output_dir):
+    """
+    Plot both outputs, their difference and its histogram per field.
+    
+    ``max_abs_diffs`` maps the variables to plot to their max absolute
+    difference, which sets the symmetric color scale of the difference map.
+    """
+    # Coordinates are read once; fields are read one pair at a time below.
+    # Everything is plotted on a strided grid: pcolormesh cost scales with
+    # the cell count
+    lon_full = ds_epygram['lon'].values
+    lat_full = ds_epygram['lat'].values
+    ny, nx = lon_full.shape
+    sy = -(-ny // PLOT_MAX_CELLS)
+    sx = -(-nx // PLOT_MAX_CELLS)
+    lon = lon_full[::sy, ::sx]
+    lat = lat_full[::sy, ::sx]
+    del lon_full, lat_full
+    
+    # Create comparison plots
+    n_fields = len(max_abs_diffs)
+    fig, axes = plt.subplots(n_fields, 4, figsize=(16, 4*n_fields),
+                             layout='constrained')
+    
+    if n_fields == 1:
+        axes = axes.reshape(1, -1)
+    
+    diff = None
+    
+    for i, (fname, max_abs_diff) in enumerate(max_abs_diffs.items()):
+        epygram_data, faxarray_data, diff = field_diff(ds_epygram, ds_faxarray,
+                                                       fname, out=diff)
         
-        # Plot
-        lon = ds_epygram['lon'].values
-        lat = ds_epygram['lat'].values
+        # EPyGrAM and faxarray on one color scale, with a shared colorbar
+        epygram_plot = epygram_data[..., ::sy, ::sx]
+        faxarray_plot = faxarray_data[..., ::sy, ::sx]
+        vmin = min(np.nanmin(epygram_plot), np.nanmin(faxarray_plot))
+        vmax = max(np.nanmax(epygram_plot), np.nanmax(faxarray_plot))
         
-        # EPyGrAM
         ax = axes[i, 0]
-        im = ax.pcolormesh(lon, lat, epygram_data, cmap='viridis')
+        im = ax.pcolormesh(lon, lat, epygram_plot, cmap='viridis', vmin=vmin, vmax=vmax)
         ax.set_title(f'EPyGrAM: {fname}')
-        plt.colorbar(im, ax=ax, shrink=0.8)
         
-        # faxarray
         ax = axes[i, 1]
-        im = ax.pcolormesh(lon, lat, faxarray_data, cmap='viridis')
+        im = ax.pcolormesh(lon, lat, faxarray_plot, cmap='viridis', vmin=vmin, vmax=vmax)
         ax.set_title(f'faxarray: {fname}')
-        plt.colorbar(im, ax=ax, shrink=0.8)
+        fig.colorbar(im, ax=axes[i, :2], shrink=0.8)
         
         # Difference
         ax = axes[i, 2]
-        vmax = max(abs(np.nanmin(diff)), abs(np.nanmax(diff)))
-        if vmax == 0:
-            vmax = 1e-10
-        im = ax.pcolormesh(lon, lat, diff, cmap='RdBu_r', vmin=-vmax, vmax=vmax)
+        vmax = max_abs_diff or 1e-10
+        # (copied: the buffer is overwritten by the next field before saving)
+        im = ax.pcolormesh(lon, lat, diff[..., ::sy, ::sx].copy(), cmap='RdBu_r',
+                           vmin=-vmax, vmax=vmax)
         ax.set_title(f'Difference (faxarray - EPyGrAM)')
-        plt.colorbar(im, ax=ax, shrink=0.8)
+        fig.colorbar(im, ax=ax, shrink=0.8)
         
         # Histogram of differences
         ax = axes[i, 3]
-        ax.hist(diff.flatten(), bins=50, edgecolor='black')
+        hist_sample = diff.ravel()[::HIST_STRIDE]
+        ax.hist(hist_sample[~np.isnan(hist_sample)], bins=50, edgecolor='black')
         ax.set_title(f'Difference histogram')
         ax.set_xlabel('Difference')
         ax.set_ylabel('Count')
         ax.axvline(x=0, color='r', linestyle='--')
     
-    plt.tight_layout()
-    
     # Save plot
     plot_file = os.path.join(output_dir, 'comparison_plot.png')
     plt.savefig(plot_file, dpi=150, bbox_inches='tight')
@@ -185,10 +391,27 @@ def compare_and_plot(ds_epygram, ds_faxarray, fields, output_dir):
     
     plt.close()
     
-    return all_close
+    return plot_file
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Compare EPyGrAM and faxarray outputs.")
+    parser.add_argument('--force', action='store_true',
+                        help="re-read the EPyGrAM reference even if the "
+                             "cached output is up to date")
+    parser.add_argument('--save-nc', action='store_true',
+                        help="also write the faxarray output to NetCDF (the "
+                             "EPyGrAM reference is always written: it is the "
+                             "cache reused by later runs)")
+    parser.add_argument('--no-plot', action='store_true',
+                        help="only compare; do not plot mismatching fields")
+    return parser.parse_args()
 
 
 def main():
+    args = parse_args()
+    
     print("="*60)
     print("VALIDATION TEST: EPyGrAM vs faxarray")
     print("="*60)
@@ -199,24 +422,41 @@ def main():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
     # Convert with both methods
-    epygram_file, ds_epygram = convert_with_epygram(FA_FILE, FIELDS_TO_TEST, OUTPUT_DIR)
-    faxarray_file, ds_faxarray = convert_with_faxarray(FA_FILE, FIELDS_TO_TEST, OUTPUT_DIR)
+    epygram_file, ds_epygram = convert_with_epygram(FA_FILE, FIELDS_TO_TEST, OUTPUT_DIR,
+                                                   force=args.force)
+    faxarray_file, ds_faxarray = convert_with_faxarray(FA_FILE, FIELDS_TO_TEST, OUTPUT_DIR,
+                                                       save=args.save_nc)
     
-    # Compare and plot
-    all_close = compare_and_plot(ds_epygram, ds_faxarray, FIELDS_TO_TEST, OUTPUT_DIR)
+    # Compare and plot. Written outputs are reopened from disk so that only
+    # the field pair being compared is held in memory
+    ds_epygram.close()
+    ds_epygram = open_output(epygram_file)
+    if faxarray_file:
+        ds_faxarray.close()
+        ds_faxarray = open_output(faxarray_file)
+    try:
+        all_close, plot_file = compare_and_plot(ds_epygram, ds_faxarray, FIELDS_TO_TEST,
+                                                OUTPUT_DIR, plot=not args.no_plot)
+    finally:
+        ds_epygram.close()
+        ds_faxarray.close()
     
     print("\n" + "="*60)
     print("SUMMARY")
     print("="*60)
     if all_close:
         print("✓ All fields match! faxarray produces identical output to EPyGrAM.")
-    else:
+    elif plot_file:
         print("⚠️ Some differences detected. Check the comparison plot.")
+    else:
+        print("⚠️ Some differences detected. Rerun without --no-plot to plot them.")
     
     print(f"\nOutput files:")
     print(f"  - {epygram_file}")
-    print(f"  - {faxarray_file}")
-    print(f"  - {os.path.join(OUTPUT_DIR, 'comparison_plot.png')}")
+    if faxarray_file:
+        print(f"  - {faxarray_file}")
+    if plot_file:
+        print(f"  - {plot_file}")
 
 
 if __name__ == '__main__':